@@ -4,38 +4,66 @@ import time
 import sys
 import random
 import digitalio
+from micropython import const
 from constants import (
-    MAIN_LOOP_INTERVAL, UART_TX, UART_RX,
-    UART_BAUDRATE, UART_TIMEOUT, CC_TIMBRE, TIMBRE_CENTER,
-    STARTUP_DELAY, DETECT_PIN
+    MAIN_LOOP_INTERVAL_NS, IDLE_LOOP_INTERVAL_NS, IDLE_PASSES_BEFORE_BACKOFF,
+    UART_TX, UART_RX,
+    UART_BAUDRATE, UART_TIMEOUT,
+    STARTUP_DELAY, DETECT_PIN, HEARTBEAT
 )
 from logging import (
     log, TAG_BARTLEBY, TAG_HW, TAG_MIDI, TAG_TRANS,
-    COLOR_CYAN, COLOR_BLUE, COLOR_MAGENTA, COLOR_GREEN, COLOR_YELLOW, COLOR_RESET
+    COLOR_CYAN, COLOR_BLUE, COLOR_MAGENTA, COLOR_GREEN, COLOR_YELLOW, COLOR_RESET,
+    STARTUP_ANIMATION, log_enabled
 )
 from transport import TransportManager, TextUart
-from state import StateManager
+from state import StateManager, sleep_ns
 from coordinator import HardwareCoordinator
 from connection import ConnectionManager
 from midi import MidiLogic
 from display import DisplayManager
 
+_LOG_BARTLEBY = log_enabled(TAG_BARTLEBY)
+
+# Instrument settings are unused, so every MIDI update shares one empty config
+_EMPTY_CONFIG = {}
+
+_CYCLE_COLORS = (COLOR_CYAN, COLOR_BLUE, COLOR_MAGENTA, COLOR_GREEN, COLOR_YELLOW)
+_CYCLE_FRAMES = const(10)
+_CYCLE_FRAME_TIME = 0.1
+_CYCLE_PREFIX = "\033[u\033[K"
+_CYCLE_SUFFIX = COLOR_RESET + "\n"
+
 def _cycle_log(message):
     """Special logging effect for startup messages."""
-    COLORS = [COLOR_CYAN, COLOR_BLUE, COLOR_MAGENTA, COLOR_GREEN, COLOR_YELLOW]
-    
-    print("\033[s", end='', file=sys.stderr)
-    
-    for i in range(10):
-        colored_text = ""
-        for char in message:
-            colored_text += random.choice(COLORS) + char
-        
-        if i == 0:
-            print(f"{colored_text}{COLOR_RESET}", file=sys.stderr)
-        else:
-            print(f"\033[u\033[K{colored_text}{COLOR_RESET}", file=sys.stderr)
-        time.sleep(0.1)
+    if not STARTUP_ANIMATION:
+        sys.stderr.write(message + "\n")
+        return
+
+    # Local names avoid repeated global lookups inside the frame loop
+    colors = _CYCLE_COLORS
+    choice = random.choice
+    write = sys.stderr.write
+    monotonic = time.monotonic
+    parts = [None] * len(message)
+
+    write("\033[s")
+
+    next_frame = monotonic()
+    for i in range(_CYCLE_FRAMES):
+        for idx, char in enumerate(message):
+            parts[idx] = choice(colors) + char
+
+        if i:
+            write(_CYCLE_PREFIX)
+        write("".join(parts))
+        write(_CYCLE_SUFFIX)
+
+        # Sleep only for whatever is left of this frame's budget
+        next_frame += _CYCLE_FRAME_TIME
+        remaining = next_frame - monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
 
 class Bartleby:
     def __init__(self):
@@ -63,6 +91,7 @@ class Bartleby:
             
             # Initialize hardware first to set up detect pin
             self.hardware = HardwareCoordinator()
+            self.hardware.set_octave_handler(self.midi.handle_octave_shift)
             log(TAG_BARTLEBY, "Hardware coordinator initialized")
             
             # Initialize displays independently
@@ -80,6 +109,18 @@ class Bartleby:
             )
             log(TAG_BARTLEBY, "Connection manager initialized")
             
+            # Bound methods used by update() every pass, resolved once here
+            self._update_time = self.state_manager.update_time
+            self._update_connection = self.connection_manager.update_state
+            self._read_hardware = self.hardware.read_hardware_state
+            self._has_text = self.text_uart.has_data
+            self._read_text = self.text_uart.read
+            self._handle_message = self.connection_manager.handle_message
+            self._midi_update = self.midi.update
+            
+            # Consecutive passes with no key, pot or message activity
+            self.idle_passes = 0
+            
             self._setup_initial_state()
         except Exception as e:
             log(TAG_BARTLEBY, f"Initialization failed: {str(e)}", is_error=True)
@@ -94,7 +135,7 @@ class Bartleby:
             log(TAG_BARTLEBY, "Encoders reset")
             
             # Force read of all pots during initialization but don't send MIDI
-            initial_pots = self.hardware.components['pots'].read_all_pots()
+            initial_pots = self.hardware.pots.read_all_pots()
             log(TAG_BARTLEBY, f"Initial pot values read: {initial_pots}")
             
             # Add startup delay to ensure both sides are ready
@@ -114,57 +155,80 @@ class Bartleby:
             raise
 
     def update(self):
-        try:
-            # Update current time
-            self.state_manager.update_time()
-            
-            # Check connection states
-            self.connection_manager.update_state()
-            
-            # Process hardware and MIDI
-            changes = self.hardware.read_hardware_state(self.state_manager)
-            
-            # Process incoming messages
-            if self.text_uart.in_waiting:
-                message = self.text_uart.read()
-                if message:
-                    try:
-                        if not message.startswith('♡'):
-                            log(TAG_BARTLEBY, f"Received message: '{message}'")
-                        self.connection_manager.handle_message(message)
-                    except Exception as e:
-                        log(TAG_BARTLEBY, f"Error processing message '{message}': {str(e)}", is_error=True)
-
-            # Handle encoder events and MIDI updates
-            if changes['encoders']:
-                self.hardware.handle_encoder_events(changes['encoders'], self.midi)
-            
-            # Process MIDI first
-            if changes['keys'] or changes['pots'] or changes['encoders']:
-                self.midi.update(
-                    changes['keys'],
-                    changes['pots'],
-                    {}  # Empty config since we're not using instrument settings
-                )
-                
-                # Then update displays for changed pots only
-                if changes['pots'] and self.displays.is_ready():
-                    for pot_num, old_val, new_val in changes['pots']:
-                        self.displays.update_pot_value(pot_num, new_val)
+        """Run one main loop pass
+        
+        Only message handling is guarded here; anything else propagates to
+        run(), which owns the single exception frame for the loop.
+        """
+        state_manager = self.state_manager
+
+        # Update current time
+        self._update_time()
+        current_time = state_manager.current_time
+        
+        # Check connection states on the state tick; messages refresh the
+        # timeout themselves, so nothing is missed between ticks
+        if state_manager.tick_state:
+            self._update_connection(current_time)
+        
+        # Process hardware and MIDI
+        keys, pots = self._read_hardware(state_manager)
+        
+        # Process every complete incoming message
+        if self._has_text():
+            read_text = self._read_text
+            message = read_text(current_time)
+            if message:
+                self.idle_passes = 0
+            while message:
+                try:
+                    if _LOG_BARTLEBY and message[0] != HEARTBEAT:
+                        log(TAG_BARTLEBY, f"Received message: '{message}'")
+                    self._handle_message(message, current_time)
+                except Exception as e:
+                    log(TAG_BARTLEBY, f"Error processing message '{message}': {str(e)}", is_error=True)
+                message = read_text(current_time)
+
+        # Process MIDI first (octave shifts were already sent during the scan)
+        if keys or pots:
+            self.idle_passes = 0
+            self._midi_update(keys, pots, _EMPTY_CONFIG)
             
-            return True
-                
-        except KeyboardInterrupt:
-            return False
-        except Exception as e:
-            log(TAG_BARTLEBY, f"Error in main loop: {str(e)}", is_error=True)
-            return False
+            # Then update displays for changed pots only
+            displays = self.displays
+            if pots and displays.is_ready():
+                displays.update_pot_values(pots)
+        else:
+            self.idle_passes += 1
+        
+        return True
 
     def run(self):
         log(TAG_BARTLEBY, "Starting main loop...")
+        # Bind the loop's callables once so each pass uses local lookups
+        update = self.update
+        monotonic_ns = time.monotonic_ns
         try:
-            while self.update():
-                time.sleep(MAIN_LOOP_INTERVAL)
+            # Pace iterations against a fixed deadline so work time is not
+            # added on top of the interval
+            next_tick = monotonic_ns()
+            while update():
+                # Back off to the idle period after a quiet stretch; any
+                # activity drops straight back to the full scan rate
+                if self.idle_passes < IDLE_PASSES_BEFORE_BACKOFF:
+                    next_tick += MAIN_LOOP_INTERVAL_NS
+                else:
+                    next_tick += IDLE_LOOP_INTERVAL_NS
+                remaining = next_tick - monotonic_ns()
+                if remaining > 0:
+                    sleep_ns(remaining)
+                else:
+                    # Fell behind; restart the schedule instead of bursting to catch up
+                    next_tick -= remaining
+        except KeyboardInterrupt:
+            pass
+        except Exception as e:
+            log(TAG_BARTLEBY, f"Error in main loop: {str(e)}", is_error=True)
         finally:
             self.cleanup()
 
@@ -187,40 +251,6 @@ class Bartleby:
         except Exception as e:
             log(TAG_BARTLEBY, f"Error during cleanup: {str(e)}", is_error=True)
 
-    def play_greeting(self):
-        """Play greeting chime using MPE"""
-        log(TAG_MIDI, "Playing MPE greeting sequence")
-        try:    
-            base_key_id = -1
-            base_pressure = 0.75
-            
-            greeting_notes = [60, 64, 67, 72]
-            velocities = [0.6, 0.7, 0.8, 0.9]
-            durations = [0.2, 0.2, 0.2, 0.4]
-            
-            for idx, (note, velocity, duration) in enumerate(zip(greeting_notes, velocities, durations)):
-                key_id = base_key_id - idx
-                channel = self.midi.channel_manager.allocate_channel(key_id)
-                note_state = self.midi.channel_manager.add_note(key_id, note, channel, int(velocity * 127))
-                
-                # Send in MPE order: CC74 → Pressure → Pitch Bend → Note On
-                self.midi.message_sender.send_message([0xB0 | channel, CC_TIMBRE, TIMBRE_CENTER])
-                self.midi.message_sender.send_message([0xD0 | channel, int(base_pressure * 127)])
-                self.midi.message_sender.send_message([0xE0 | channel, 0x00, 0x40])  # Center pitch bend
-                self.midi.message_sender.send_message([0x90 | channel, note, int(velocity * 127)])
-                
-                time.sleep(duration)
-                
-                self.midi.message_sender.send_message([0xD0 | channel, 0])  # Zero pressure
-                self.midi.message_sender.send_message([0x80 | channel, note, 0])
-                self.midi.channel_manager.release_note(key_id)
-                
-                time.sleep(0.05)
-                
-                log(TAG_MIDI, f"Played greeting note {idx+1}/4: {note}")
-        except Exception as e:
-            log(TAG_MIDI, f"Error playing greeting sequence: {str(e)}", is_error=True)
-
 def main():
     try:
         controller = Bartleby()
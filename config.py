@@ -7,6 +7,34 @@ from constants import (
 )
 from logging import log, TAG_CONFIG
 
+def _build_mpe_setup():
+    """Build the fixed MPE setup sequence as raw CC messages"""
+    messages = [
+        # Reset all channels first
+        (0xB0, 121, 0),  # Reset all controllers
+        (0xB0, 123, 0),  # All notes off
+        
+        # Configure MPE zone (RPN 6)
+        (0xB0, 101, 0),  # RPN MSB
+        (0xB0, 100, 6),  # RPN LSB (MCM)
+        (0xB0, 6, ZONE_END - ZONE_START + 1),
+        
+        # Configure Manager Channel pitch bend range
+        (0xB0, 101, 0),  # RPN MSB
+        (0xB0, 100, 0),  # RPN LSB (pitch bend)
+        (0xB0, 6, MPE_MASTER_PITCH_BEND_RANGE)
+    ]
+    
+    # Configure Member Channel pitch bend range
+    for channel in range(ZONE_START, ZONE_END + 1):
+        messages.append((0xB0 | channel, 101, 0))  # RPN MSB
+        messages.append((0xB0 | channel, 100, 0))  # RPN LSB (pitch bend)
+        messages.append((0xB0 | channel, 6, MPE_MEMBER_PITCH_BEND_RANGE))
+    return tuple(messages)
+
+# The setup never changes, so it is built once at import
+_MPE_SETUP_MESSAGES = _build_mpe_setup()
+
 class MPEConfigurator:
     """Handles MPE-specific configuration and setup"""
     def __init__(self, message_sender):
@@ -15,29 +43,11 @@ class MPEConfigurator:
     def configure_mpe(self):
         """Configure MPE zones and pitch bend ranges"""
         log(TAG_CONFIG, "Configuring MPE zones and pitch bend ranges")
-            
-        # Reset all channels first
-        self.message_sender.send_message([0xB0, 121, 0])  # Reset all controllers
-        self.message_sender.send_message([0xB0, 123, 0])  # All notes off
         
-        # Configure MPE zone (RPN 6)
-        self.message_sender.send_message([0xB0, 101, 0])  # RPN MSB
-        self.message_sender.send_message([0xB0, 100, 6])  # RPN LSB (MCM)
-        zone_size = ZONE_END - ZONE_START + 1
-        self.message_sender.send_message([0xB0, 6, zone_size])
-        log(TAG_CONFIG, f"MPE zone configured: {zone_size} channels")
-        
-        # Configure Manager Channel pitch bend range
-        self.message_sender.send_message([0xB0, 101, 0])  # RPN MSB
-        self.message_sender.send_message([0xB0, 100, 0])  # RPN LSB (pitch bend)
-        self.message_sender.send_message([0xB0, 6, MPE_MASTER_PITCH_BEND_RANGE])
+        # Whole sequence goes out as one write per output
+        self.message_sender.send_messages(_MPE_SETUP_MESSAGES)
+        log(TAG_CONFIG, f"MPE zone configured: {ZONE_END - ZONE_START + 1} channels")
         log(TAG_CONFIG, f"Manager channel pitch bend range: {MPE_MASTER_PITCH_BEND_RANGE} semitones")
-        
-        # Configure Member Channel pitch bend range
-        for channel in range(ZONE_START, ZONE_END + 1):
-            self.message_sender.send_message([0xB0 | channel, 101, 0])  # RPN MSB
-            self.message_sender.send_message([0xB0 | channel, 100, 0])  # RPN LSB (pitch bend)
-            self.message_sender.send_message([0xB0 | channel, 6, MPE_MEMBER_PITCH_BEND_RANGE])
         log(TAG_CONFIG, f"Member channels pitch bend range: {MPE_MEMBER_PITCH_BEND_RANGE} semitones")
 
 class ConfigurationManager:
@@ -182,7 +192,7 @@ class ConfigurationManager:
         """Send current pot values after config change"""
         try:
             log(TAG_CONFIG, "Reading current pot values")
-            all_pots = self.hardware.components['pots'].read_all_pots()
+            all_pots = self.hardware.pots.read_all_pots()
             pot_changes = []
             
             for pot_index, normalized_value in all_pots:
@@ -3,10 +3,10 @@
 import board
 import time
 from constants import (
-    DETECT_PIN, COMMUNICATION_TIMEOUT, STARTUP_DELAY,
-    BUFFER_CLEAR_TIMEOUT, VALID_CARTRIDGES, ZONE_MANAGER
+    DETECT_PIN, COMMUNICATION_TIMEOUT_NS, STARTUP_DELAY,
+    BUFFER_CLEAR_TIMEOUT, VALID_CARTRIDGES, ZONE_MANAGER, HEARTBEAT
 )
-from logging import log, TAG_CONNECT
+from logging import log, TAG_CONNECT, HEARTBEAT_DEBUG
 
 class ConnectionManager:
     """
@@ -26,6 +26,10 @@ class ConnectionManager:
     # Config acknowledgment
     CONFIG_CC = 127     # CC number for config acknowledgment
     CONFIG_EMPTY = 0    # Value for empty config
+    # Prebuilt ack arguments for midi.update, shared by every empty config
+    EMPTY_CONFIG_ACK = ((CONFIG_CC, 0, CONFIG_EMPTY),)
+    NO_KEYS = ()
+    NO_CONFIG = {}
     
     def __init__(self, text_uart, hardware_coordinator, midi_logic, transport_manager, display_manager):
         try:
@@ -37,7 +41,8 @@ class ConnectionManager:
             
             # Connection state
             self.state = self.STANDALONE
-            self.last_message_time = time.monotonic()
+            self.last_message_time = time.monotonic_ns()
+            self.timeout_deadline = self.last_message_time + COMMUNICATION_TIMEOUT_NS
             
             # Config state
             self.config_state = self.DEFAULT
@@ -52,34 +57,49 @@ class ConnectionManager:
             log(TAG_CONNECT, f"Failed to initialize connection manager: {str(e)}", is_error=True)
             raise
         
-    def update_state(self):
-        """Check for timeouts"""
-        if self.state != self.STANDALONE:
-            current_time = time.monotonic()
-            time_since_last = current_time - self.last_message_time
-            if time_since_last > COMMUNICATION_TIMEOUT:
-                log(TAG_CONNECT, f"Communication timeout ({time_since_last:.1f}s) - returning to standalone")
-                self._reset_state()
+    def update_state(self, current_time=None):
+        """Check for timeouts using the main loop's cached monotonic_ns time when provided"""
+        if self.state == self.STANDALONE:
+            return
+        if current_time is None:
+            current_time = time.monotonic_ns()
+        # Deadline is refreshed on every message, so the steady state is one compare
+        if current_time > self.timeout_deadline:
+            log(TAG_CONNECT, f"Communication timeout ({(current_time - self.last_message_time) / 1000000000:.1f}s) - returning to standalone")
+            self._reset_state()
                 
-    def handle_message(self, message):
-        """Process incoming text messages"""
+    def handle_message(self, message, current_time=None):
+        """Process incoming text messages, stamped with the main loop's monotonic_ns time when provided"""
         if not message:
             return
             
-        # Any message updates last message time
-        self.last_message_time = time.monotonic()
+        # Any message updates last message time and pushes out the timeout
+        if current_time is None:
+            current_time = time.monotonic_ns()
+        self.last_message_time = current_time
+        self.timeout_deadline = self.last_message_time + COMMUNICATION_TIMEOUT_NS
         
         try:
+            # Dispatch on the first character; heartbeats are by far the most frequent
+            first = message[0]
+            
+            # Handle heartbeat
+            if first == HEARTBEAT:
+                if HEARTBEAT_DEBUG:
+                    log(TAG_CONNECT, HEARTBEAT, is_heartbeat=True)
+                return
+            
             # Handle ⚡ message - transition to ATTACHED if in CONNECTING and CONFIGURED
-            if message.startswith("⚡"):
+            if first == "⚡":
                 if self.state == self.CONNECTING and self.config_state == self.CONFIGURED:
                     self.state = self.ATTACHED
                     log(TAG_CONNECT, "Received confirmation ⚡ - Connection state -> ATTACHED")
                 return
             
             # Check if message starts with a valid cartridge name
-            cartridge_name = message.split('|')[0] if '|' in message else ''
-            if cartridge_name in VALID_CARTRIDGES:
+            # Slice up to the first separator instead of splitting the whole config
+            separator = message.find('|')
+            if separator >= 0 and message[:separator] in VALID_CARTRIDGES:
                 if self.state == self.STANDALONE:
                     log(TAG_CONNECT, "Valid cartridge detected - entering CONNECTING state")
                     self.state = self.CONNECTING
@@ -103,12 +123,6 @@ class ConnectionManager:
                     else:
                         # If already configured, keep existing config
                         log(TAG_CONNECT, "Config update failed - keeping existing configuration")
-                return
-                
-            # Handle heartbeat
-            if message.startswith("♡"):
-                log(TAG_CONNECT, "♡", is_heartbeat=True)
-                return
                 
         except Exception as e:
             log(TAG_CONNECT, f"Error processing message: {str(e)}", is_error=True)
@@ -135,7 +149,7 @@ class ConnectionManager:
             if len(parts) == 3:
                 log(TAG_CONNECT, f"Empty CC Configuration parsed for {self.cartridge_name} ({self.instrument_name})")
                 # Send empty config acknowledgment
-                self.midi.update([], [(self.CONFIG_CC, 0, self.CONFIG_EMPTY)], {})
+                self.midi.update(self.NO_KEYS, self.EMPTY_CONFIG_ACK, self.NO_CONFIG)
                 log(TAG_CONNECT, f"Sent empty config ack: CC {self.CONFIG_CC} = {self.CONFIG_EMPTY}")
                 # Send empty config to MIDI system
                 return self.midi.handle_config_message("cc:")
@@ -205,7 +219,7 @@ class ConnectionManager:
         """Send current pot values as MIDI messages"""
         try:
             # Only read pots that have CC mappings
-            all_pots = self.hardware.components['pots'].read_all_pots()
+            all_pots = self.hardware.pots.read_all_pots()
             pot_changes = []
             
             for pot_index, normalized_value in all_pots:
@@ -214,7 +228,7 @@ class ConnectionManager:
             
             # Send pot values
             if pot_changes:
-                self.midi.update([], pot_changes, {})
+                self.midi.update(self.NO_KEYS, pot_changes, self.NO_CONFIG)
                 log(TAG_CONNECT, f"Sent {len(pot_changes)} pot values")
                 
         except Exception as e:
@@ -225,19 +239,18 @@ class ConnectionManager:
         try:
             self.state = self.STANDALONE
             self.config_state = self.DEFAULT
-            self.last_message_time = time.monotonic()
+            self.last_message_time = time.monotonic_ns()
+            self.timeout_deadline = self.last_message_time + COMMUNICATION_TIMEOUT_NS
             self.cartridge_name = None
             self.instrument_name = None
             self.pot_mapping.clear()
             
             # Clear both UART and text protocol buffers
+            # flush_buffers polls in_waiting until the line is quiet, so no fixed delay is needed
             self.transport.flush_buffers()
             if hasattr(self.uart, 'clear_buffer'):
                 self.uart.clear_buffer()
-            
-            # Add a small delay to ensure we're ready for new messages
-            time.sleep(0.1)  # 100ms delay
-            
+
             log(TAG_CONNECT, "Reset to initial state")
         except Exception as e:
             log(TAG_CONNECT, f"Error during state reset: {str(e)}", is_error=True)
@@ -1,6 +1,7 @@
 """Constants for Bartleby synthesizer."""
 
 import board
+from micropython import const
 
 # Hardware Setup
 SETUP_DELAY = 0.1
@@ -8,10 +9,11 @@ SETUP_DELAY = 0.1
 # I2C Display Setup
 I2C_SDA = board.GP18
 I2C_SCL = board.GP19
-I2C_MUX_ADDRESS = 0x70  # TCA9548A default address
-OLED_ADDRESS = 0x3C    # SSD1306 default address
-OLED_WIDTH = 128
-OLED_HEIGHT = 64
+I2C_FREQUENCY = const(400000)  # SSD1306 supports 400kHz fast mode (busio default is 100kHz)
+I2C_MUX_ADDRESS = const(0x70)  # TCA9548A default address
+OLED_ADDRESS = const(0x3C)    # SSD1306 default address
+OLED_WIDTH = const(128)
+OLED_HEIGHT = const(64)
 OLED_CHANNELS = [0, 1, 2, 3, 4]  # Using first 5 channels of TCA9548A
 SCREEN_ROTATIONS = [2, 2, 2, 2, 2]  # Rotation for each display (0=normal, 1=90deg, 2=180deg, 3=270deg)
 SCREEN_ORDER = [4, 3, 2, 1, 0]  # Order of displays (e.g. [4,0,1,2,3] to move display 4 to start)
@@ -21,29 +23,36 @@ UART_TX = board.GP16
 UART_RX = board.GP17
 
 # Timing Intervals
-POT_SCAN_INTERVAL = 0.02
-ENCODER_SCAN_INTERVAL = 0.001
-MAIN_LOOP_INTERVAL = 0.001
-MESSAGE_TIMEOUT = 0.5  # Increased from 0.05s to 0.5s for more reliable message assembly
+# Scan intervals are integer nanoseconds to match time.monotonic_ns()
+POT_SCAN_INTERVAL_NS = const(20000000)  # 20ms
+ENCODER_SCAN_INTERVAL_NS = const(1000000)  # 1ms
+STATE_TICK_INTERVAL_NS = const(10000000)  # 10ms between connection timeout checks
+MAIN_LOOP_INTERVAL_NS = const(1000000)  # 1ms main loop period
+IDLE_LOOP_INTERVAL_NS = const(5000000)  # Loop period once the controls have been idle a while
+IDLE_PASSES_BEFORE_BACKOFF = const(100)  # Quiet passes before switching to the idle period
+MESSAGE_TIMEOUT_NS = const(500000000)  # 0.5s (increased from 0.05s) for more reliable message assembly
 
 # MIDI Settings
-UART_BAUDRATE = 31250
+UART_BAUDRATE = const(31250)
 UART_TIMEOUT = 0.005  # Increased from 0.001s to 0.005s for more complete reads
+MIDI_BATCH_SIZE = const(192)  # Bytes of raw MIDI queued per batch before an early flush
 
 # MIDI Control Constants
-CC_TIMBRE = 74
-TIMBRE_CENTER = 64
+CC_TIMBRE = const(74)
+TIMBRE_CENTER = const(64)
 
 # Connection Constants
 DETECT_PIN = board.GP22
-COMMUNICATION_TIMEOUT = 5.0  # Time without any message before disconnect
+COMMUNICATION_TIMEOUT_NS = 5000000000  # 5s without any message before disconnect (too large for const)
 STARTUP_DELAY = 1.0  # Give devices time to initialize
 BUFFER_CLEAR_TIMEOUT = 0.2  # Increased from 0.1s to 0.2s for complete buffer clearing
-VALID_CARTRIDGES = ["Candide", "Don Quixote"]  # List of known cartridge names
+VALID_CARTRIDGES = ("Candide", "Don Quixote")  # Known cartridge names (tuple for fast membership)
+HEARTBEAT = '♡'  # Heartbeat message sent by the cartridge (single character)
+HEARTBEAT_BYTES = b'\xe2\x99\xa1'  # UTF-8 encoding of HEARTBEAT, for checks before decoding
 
 # ADC Constants
-ADC_MAX = 65535
-ADC_MIN = 1
+ADC_MAX = const(65535)
+ADC_MIN = const(1)
 
 # Pin Definitions
 KEYBOARD_L1A_MUX_SIG = board.GP26
@@ -73,24 +82,24 @@ OCTAVE_UP_PIN = board.GP20    # Previously OCTAVE_ENC_CLK
 OCTAVE_DOWN_PIN = board.GP21  # Previously OCTAVE_ENC_DT
 
 # Potentiometer Constants
-POT_THRESHOLD = 1500  # Threshold for initial pot activation
-POT_CHANGE_THRESHOLD = 400  # Threshold for subsequent changes when pot is active
+POT_THRESHOLD = const(1500)  # Threshold for initial pot activation
+POT_CHANGE_THRESHOLD = const(400)  # Threshold for subsequent changes when pot is active
 POT_LOWER_TRIM = 0.05
 POT_UPPER_TRIM = 0.0
 POT_LOG_THRESHOLD = 0.01  # Threshold for logging pot changes
-NUM_POTS = 16
+NUM_POTS = const(16)
 
 # Keyboard Constants
-NUM_KEYS = 25
-NUM_CHANNELS = 50
+NUM_KEYS = const(25)
+NUM_CHANNELS = const(50)
 
 # Sensor Constants
-MAX_VK_RESISTANCE = 25000
-MIN_VK_RESISTANCE = 1100
+MAX_VK_RESISTANCE = const(25000)
+MIN_VK_RESISTANCE = const(1100)
 INITIAL_ACTIVATION_THRESHOLD = 0  # Removed threshold - note-on will fire with any detectable pressure
 DEACTIVATION_THRESHOLD = 0.000015
 REST_VOLTAGE_THRESHOLD = 3.3
-ADC_RESISTANCE_SCALE = 100000
+ADC_RESISTANCE_SCALE = const(100000)
 
 # MIDI Curve Constants
 PRESSURE_CURVE = 0.3  # 0.0 = linear, 1.0 = extreme middle expansion
@@ -98,39 +107,39 @@ BEND_CURVE = 0      # 0.0 = linear, 1.0 = extreme middle stability
 
 # MIDI Velocity Settings
 VELOCITY_DELAY = 0
-PRESSURE_HISTORY_SIZE = 8  # Increased from 3 to 8 for better release velocity calculation
+PRESSURE_HISTORY_SIZE = const(8)  # Increased from 3 to 8 for better release velocity calculation
 RELEASE_VELOCITY_THRESHOLD = 0.01
 RELEASE_VELOCITY_SCALE = 0.5
 
 # MPE Configuration
-ZONE_MANAGER = 0
-ZONE_START = 1
-ZONE_END = 15
+ZONE_MANAGER = const(0)
+ZONE_START = const(1)
+ZONE_END = const(15)
 
 # MIDI CC Numbers - Standard Controls
-CC_MODULATION = 1
-CC_VOLUME = 7
-CC_FILTER_RESONANCE = 71
-CC_RELEASE_TIME = 72
-CC_ATTACK_TIME = 73
-CC_DECAY_TIME = 75
-CC_SUSTAIN_LEVEL = 76
+CC_MODULATION = const(1)
+CC_VOLUME = const(7)
+CC_FILTER_RESONANCE = const(71)
+CC_RELEASE_TIME = const(72)
+CC_ATTACK_TIME = const(73)
+CC_DECAY_TIME = const(75)
+CC_SUSTAIN_LEVEL = const(76)
 
 # MIDI RPN Messages
-RPN_MSB = 0
-RPN_LSB_MPE = 6
-RPN_LSB_PITCH = 0
+RPN_MSB = const(0)
+RPN_LSB_MPE = const(6)
+RPN_LSB_PITCH = const(0)
 
 # MIDI Pitch Bend
-PITCH_BEND_CENTER = 8192
-PITCH_BEND_MAX = 16383
+PITCH_BEND_CENTER = const(8192)
+PITCH_BEND_MAX = const(16383)
 
 # Note Management
-MAX_ACTIVE_NOTES = 15
+MAX_ACTIVE_NOTES = const(15)
 
 # MPE Settings
-MPE_MEMBER_PITCH_BEND_RANGE = 48
-MPE_MASTER_PITCH_BEND_RANGE = 2
+MPE_MEMBER_PITCH_BEND_RANGE = const(48)
+MPE_MASTER_PITCH_BEND_RANGE = const(2)
 
 # Default CC Assignments
 DEFAULT_CC_ASSIGNMENTS = {
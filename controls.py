@@ -2,7 +2,9 @@ from constants import (
     DEFAULT_CC_ASSIGNMENTS,
     ZONE_MANAGER
 )
-from logging import log, TAG_CONTROL
+from logging import log, log_enabled, TAG_CONTROL
+
+_LOG_CONTROL = log_enabled(TAG_CONTROL)
 
 class ControllerManager:
     """Manages controller assignments and configuration for pots"""
@@ -57,7 +59,7 @@ class ControllerManager:
             return True
 
         except Exception as e:
-            print(f"Error parsing controller config: {str(e)}")
+            log(TAG_CONTROL, f"Error parsing controller config: {str(e)}", is_error=True)
             return False
 
 class MidiControlProcessor:
@@ -75,7 +77,8 @@ class MidiControlProcessor:
             # Scale to MIDI range and clamp to ensure valid CC value
             midi_value = min(127, max(0, int(new_value * 127)))
             midi_events.append(('control_change', controller_number, midi_value))
-            log(TAG_CONTROL, f"Controller {pot_index} changed: CC{controller_number}={midi_value}")
+            if _LOG_CONTROL:
+                log(TAG_CONTROL, f"Controller {pot_index} changed: CC{controller_number}={midi_value}")
         return midi_events
 
     def handle_config_message(self, message):
@@ -2,10 +2,10 @@
 
 import digitalio
 import time
-from hardware import (
-    Multiplexer, KeyboardHandler, OctaveButtonHandler, 
-    PotentiometerHandler
-)
+from mux import Multiplexer
+from keyboard import KeyboardHandler
+from encoder import OctaveButtonHandler
+from pots import PotentiometerHandler
 from constants import (
     SETUP_DELAY, DETECT_PIN,
     CONTROL_MUX_SIG, CONTROL_MUX_S0, CONTROL_MUX_S1, CONTROL_MUX_S2, CONTROL_MUX_S3,
@@ -14,14 +14,25 @@ from constants import (
     KEYBOARD_L1B_MUX_SIG, KEYBOARD_L1B_MUX_S0, KEYBOARD_L1B_MUX_S1, KEYBOARD_L1B_MUX_S2, KEYBOARD_L1B_MUX_S3,
     KEYBOARD_L2_MUX_S0, KEYBOARD_L2_MUX_S1, KEYBOARD_L2_MUX_S2, KEYBOARD_L2_MUX_S3
 )
-from logging import log, TAG_HW
+from logging import log, log_enabled, TAG_HW
+
+# Shared placeholder for sources that were not scanned this pass
+_NO_CHANGES = ()
+
+_LOG_HW = log_enabled(TAG_HW)
 
 class HardwareCoordinator:
     def __init__(self):
         log(TAG_HW, "Initializing hardware coordinator")
+        # Called with +1/-1 on each octave shift; see set_octave_handler
+        self.octave_handler = None
         try:
-            # Initialize components
-            self.components = self._initialize_components()
+            # Initialize components as plain attributes (no dict lookup per scan)
+            self._initialize_components()
+            # Bound scan methods so read_hardware_state skips the component hop
+            self._read_keys = self.keyboard.read_keys
+            self._read_pots = self.pots.read_pots
+            self._poll_octave = self.octave_control.poll
             time.sleep(SETUP_DELAY)
             log(TAG_HW, "Hardware initialization complete")
         except Exception as e:
@@ -31,7 +42,7 @@ class HardwareCoordinator:
     def _initialize_components(self):
         try:
             log(TAG_HW, "Initializing control multiplexer")
-            control_mux = Multiplexer(
+            self.control_mux = Multiplexer(
                 CONTROL_MUX_SIG,
                 CONTROL_MUX_S0,
                 CONTROL_MUX_S1,
@@ -40,23 +51,16 @@ class HardwareCoordinator:
             )
             
             log(TAG_HW, "Setting up keyboard")
-            keyboard = self._setup_keyboard()
+            self.keyboard = self._setup_keyboard()
             
             log(TAG_HW, "Initializing octave buttons")
-            octave_control = OctaveButtonHandler(
+            self.octave_control = OctaveButtonHandler(
                 OCTAVE_UP_PIN,
                 OCTAVE_DOWN_PIN
             )
             
             log(TAG_HW, "Initializing potentiometers")
-            pots = PotentiometerHandler(control_mux)
-            
-            return {
-                'control_mux': control_mux,
-                'keyboard': keyboard,
-                'octave_control': octave_control,
-                'pots': pots
-            }
+            self.pots = PotentiometerHandler(self.control_mux)
         except Exception as e:
             log(TAG_HW, f"Component initialization failed: {str(e)}", is_error=True)
             raise
@@ -95,52 +99,41 @@ class HardwareCoordinator:
             raise
     
     def read_hardware_state(self, state_manager):
-        changes = {
-            'keys': [],
-            'pots': [],
-            'encoders': []
-        }
+        """Scan hardware and return (keys, pots) change sequences
+        
+        Octave shifts are not returned; they go straight to the octave handler.
+        """
+        keys = pots = _NO_CHANGES
         
         try:
             # Always read keys at full speed
-            changes['keys'] = self.components['keyboard'].read_keys()
-            if changes['keys']:
-                log(TAG_HW, f"Keys changed: {len(changes['keys'])} events")
+            keys = self._read_keys()
+            if _LOG_HW and keys:
+                log(TAG_HW, f"Keys changed: {len(keys)} events")
             
-            # Read pots at interval
-            if state_manager.should_scan_pots():
-                changes['pots'] = self.components['pots'].read_pots()
-                if changes['pots']:
-                    log(TAG_HW, f"Pots changed: {len(changes['pots'])} events")
-                state_manager.update_pot_scan_time()
+            # Read pots at interval (deadline set by StateManager.update_time)
+            if state_manager.scan_pots:
+                pots = self._read_pots()
+                if _LOG_HW and pots:
+                    log(TAG_HW, f"Pots changed: {len(pots)} events")
             
             # Read octave buttons at interval
-            if state_manager.should_scan_encoders():
-                new_events = self.components['octave_control'].read_buttons()
-                if new_events:
-                    changes['encoders'].extend(new_events)
-                    log(TAG_HW, f"Octave changed: {len(new_events)} events")
-                state_manager.update_encoder_scan_time()
-                
-            return changes
+            if state_manager.scan_encoders and self.octave_handler:
+                self._poll_octave(self.octave_handler)
             
         except Exception as e:
             log(TAG_HW, f"Error reading hardware state: {str(e)}", is_error=True)
-            return changes
+            
+        return keys, pots
     
-    def handle_encoder_events(self, encoder_events, midi):
-        try:
-            for event in encoder_events:
-                if event[0] == 'rotation':
-                    _, direction = event[1:3]
-                    midi.handle_octave_shift(direction)
-                    log(TAG_HW, f"Octave shifted {direction}: new position {self.components['octave_control'].get_position()}")
-        except Exception as e:
-            log(TAG_HW, f"Error handling encoder events: {str(e)}", is_error=True)
+    def set_octave_handler(self, handler):
+        """Set the callable that receives each octave shift direction"""
+        self.octave_handler = handler
+        log(TAG_HW, "Octave handler set")
     
     def reset_encoders(self):
         try:
-            self.components['octave_control'].reset_position()
+            self.octave_control.reset_position()
             log(TAG_HW, "Octave position reset")
         except Exception as e:
             log(TAG_HW, f"Error resetting encoders: {str(e)}", is_error=True)
@@ -1,15 +1,18 @@
 """OLED display management through I2C multiplexer."""
 
-import time
 import busio
 import board
 from adafruit_ssd1306 import SSD1306_I2C
 from adafruit_tca9548a import TCA9548A
 from constants import (
-    I2C_SDA, I2C_SCL, I2C_MUX_ADDRESS, OLED_ADDRESS,
-    OLED_WIDTH, OLED_HEIGHT, OLED_CHANNELS, SCREEN_ROTATIONS, SCREEN_ORDER
+    I2C_SDA, I2C_SCL, I2C_FREQUENCY, I2C_MUX_ADDRESS, OLED_ADDRESS,
+    OLED_WIDTH, OLED_HEIGHT, OLED_CHANNELS, SCREEN_ROTATIONS, SCREEN_ORDER,
+    MAIN_LOOP_INTERVAL_NS
 )
-from logging import log, TAG_DISPLAY
+from logging import log, log_enabled, TAG_DISPLAY
+from state import sleep_ns
+
+_LOG_DISPLAY = log_enabled(TAG_DISPLAY)
 
 class ConfigData:
     def __init__(self):
@@ -183,7 +186,7 @@ class DisplayManager:
             self.displays = []
             
             # Initialize I2C bus and multiplexer
-            self.i2c = busio.I2C(I2C_SCL, I2C_SDA)
+            self.i2c = busio.I2C(I2C_SCL, I2C_SDA, frequency=I2C_FREQUENCY)
             self.mux = TCA9548A(self.i2c, address=I2C_MUX_ADDRESS)
             
             # Initialize displays in specified order
@@ -193,7 +196,7 @@ class DisplayManager:
                     if self.i2c.try_lock():
                         try:
                             self.i2c.writeto(I2C_MUX_ADDRESS, bytes([1 << channel]))
-                            time.sleep(0.001)  # Reduced delay - same as main loop interval
+                            sleep_ns(MAIN_LOOP_INTERVAL_NS)  # Reduced delay - same as main loop interval
                         finally:
                             self.i2c.unlock()
                     
@@ -220,8 +223,8 @@ class DisplayManager:
             
             log(TAG_DISPLAY, f"Display manager initialization complete. {len(self.displays)} displays ready")
             
-            # Brief delay to show greeting
-            time.sleep(0.5)
+            # Precompute which display index shows each pot so updates skip the channel search
+            self.pot_display_index = [self._find_display_for_pot(pot_num) for pot_num in range(16)]
             
             # Show initial values (all zeros) on first 4 displays
             log(TAG_DISPLAY, "Showing initial pot values")
@@ -248,7 +251,7 @@ class DisplayManager:
         if self.i2c.try_lock():
             try:
                 self.i2c.writeto(I2C_MUX_ADDRESS, bytes([1 << channel]))
-                time.sleep(0.001)  # Reduced delay - same as main loop interval
+                sleep_ns(MAIN_LOOP_INTERVAL_NS)  # Reduced delay - same as main loop interval
             finally:
                 self.i2c.unlock()
 
@@ -284,7 +287,8 @@ class DisplayManager:
                 display.fill(0)
                 display.text(str(text), x, y, 1)
                 display.show()
-                log(TAG_DISPLAY, f"Updated display {display_index} with text: {text}")
+                if _LOG_DISPLAY:
+                    log(TAG_DISPLAY, f"Updated display {display_index} with text: {text}")
             else:
                 log(TAG_DISPLAY, f"Invalid display index: {display_index}", is_error=True)
         except Exception as e:
@@ -323,7 +327,8 @@ class DisplayManager:
                     display.fill_rect(x, y, fill_width, height, 1)
                 display.show()
                 
-                log(TAG_DISPLAY, f"Updated bar on display {display_index} to {value:.2f}")
+                if _LOG_DISPLAY:
+                    log(TAG_DISPLAY, f"Updated bar on display {display_index} to {value:.2f}")
             else:
                 log(TAG_DISPLAY, f"Invalid display index: {display_index}", is_error=True)
         except Exception as e:
@@ -337,47 +342,46 @@ class DisplayManager:
         """Return the number of initialized displays."""
         return len(self.displays)
     
+    def _find_display_for_pot(self, pot_num):
+        """Find the display index that shows a pot, or None if that display is missing."""
+        # Pots 0,1 -> position 0, pots 2,3 -> position 1, ... same pattern for pots 8-15
+        channel = SCREEN_ORDER[(pot_num % 8) // 2]
+        for i, display in enumerate(self.displays):
+            if display['channel'] == channel:
+                return i
+        return None
+
     def update_pot_value(self, pot_num, value):
-        """Update a single pot value and mark its display for refresh.
+        """Update a single pot value and refresh its display.
         
         Args:
             pot_num: Which pot changed (0-15)
             value: New normalized value (0.0-1.0)
         """
+        self.update_pot_values(((pot_num, None, value),))
+
+    def update_pot_values(self, pot_changes):
+        """Update several pot values, refreshing each affected display only once.
+        
+        Args:
+            pot_changes: Iterable of (pot_num, old_value, new_value) tuples
+        """
         try:
-            if 0 <= pot_num < 16:
-                # Update stored value
-                self.pot_values[pot_num] = value
-                
-                # Calculate which display position (0-3) this pot belongs to
-                # Pots 0,1 -> position 0
-                # Pots 2,3 -> position 1
-                # Pots 4,5 -> position 2
-                # Pots 6,7 -> position 3
-                # Same pattern for pots 8-15
-                display_position = (pot_num % 8) // 2
-                
-                # Get the channel number for this position from SCREEN_ORDER
-                channel = SCREEN_ORDER[display_position]
-                
-                log(TAG_DISPLAY, f"Mapping pot {pot_num} -> display position {display_position} -> channel {channel}")
-                
-                # Find the display index that has this channel
-                display_index = None
-                for i, display in enumerate(self.displays):
-                    if display['channel'] == channel:
-                        display_index = i
-                        break
-                
-                log(TAG_DISPLAY, f"Found display index {display_index} for pot {pot_num}")
-                
-                # Update display if found and initialized
-                if display_index is not None and 0 <= display_index < len(self.displays):
-                    self.update_display_with_config(display_index)
-                    log(TAG_DISPLAY, f"Updated display {display_index} (channel {channel}, position {display_position}) for pot {pot_num}")
+            pending = []
+            for pot_num, _, value in pot_changes:
+                if 0 <= pot_num < 16:
+                    self.pot_values[pot_num] = value
+                    display_index = self.pot_display_index[pot_num]
+                    if display_index is not None and display_index not in pending:
+                        pending.append(display_index)
+            
+            for display_index in pending:
+                self.update_display_with_config(display_index)
+                if _LOG_DISPLAY:
+                    log(TAG_DISPLAY, f"Updated display {display_index} for pot changes")
                 
         except Exception as e:
-            log(TAG_DISPLAY, f"Error updating pot {pot_num}: {str(e)}", is_error=True)
+            log(TAG_DISPLAY, f"Error updating pot values: {str(e)}", is_error=True)
         
     def deinit(self):
         """Clean up resources."""
@@ -1,30 +1,46 @@
 """Button-based octave control."""
 
-import digitalio
+import keypad
+from micropython import const
 from logging import log, TAG_ENCODER
 
+# Button state is packed as bit 0 = up pressed, bit 1 = down pressed.
+# Indexed by (previous_state << 2) | current_state, each entry says which
+# button was freshly pressed: 0 = none, 1 = up, 2 = down. Pressing both at
+# once cancels out, and holding one button while pressing the other
+# counts as a single press of the new one.
+_PRESS_TABLE = bytes((
+    0, 1, 2, 0,
+    0, 0, 2, 2,
+    0, 1, 0, 1,
+    0, 0, 0, 0,
+))
+_PRESS_UP = const(1)
+_PRESS_DOWN = const(2)
+
 class OctaveButtonHandler:
     def __init__(self, up_pin, down_pin):
         """Initialize octave button handler"""
         try:
             log(TAG_ENCODER, "Initializing octave button handler")
             
-            # Initialize buttons
-            self.up_button = digitalio.DigitalInOut(up_pin)
-            self.up_button.direction = digitalio.Direction.INPUT
-            self.up_button.pull = digitalio.Pull.UP
-            
-            self.down_button = digitalio.DigitalInOut(down_pin)
-            self.down_button.direction = digitalio.Direction.INPUT
-            self.down_button.pull = digitalio.Pull.UP
+            # keypad scans and debounces both buttons in the background
+            # (key 0 = up, key 1 = down; pressed pulls the pin low)
+            self.buttons = keypad.Keys(
+                (up_pin, down_pin),
+                value_when_pressed=False,
+                pull=True
+            )
+            self.event = keypad.Event()  # Reused by every poll
             
             self.min_position = -3  # Allow down three octaves
             self.max_position = 3   # Allow up three octaves
             self.current_position = 0
             
-            # Track previous button states
-            self.last_up_state = True    # Pulled high when not pressed
-            self.last_down_state = True  # Pulled high when not pressed
+            # Track previous button states, starting as "both pressed" so a
+            # button held during boot does not register until released
+            self.last_state = 3       # State at the end of the last poll
+            self.state = 0            # State as reported by keypad events
             
             log(TAG_ENCODER, "Initialized octave buttons")
             
@@ -40,40 +56,49 @@ class OctaveButtonHandler:
         except Exception as e:
             log(TAG_ENCODER, f"Error resetting position: {str(e)}", is_error=True)
 
-    def read_buttons(self):
-        """Read buttons and return events if position changed"""
-        events = []
+    def poll(self, callback):
+        """Read buttons and call callback(direction) if position changed
+        
+        The shift is delivered straight to the callback, so no event list
+        or tuple is built for each scan.
+        """
         try:
-            # Read current button states (False = pressed since pulled up)
-            up_pressed = not self.up_button.value
-            down_pressed = not self.down_button.value
+            # Apply every queued (already debounced) event to the state
+            state = self.state
+            event = self.event
+            get_into = self.buttons.events.get_into
+            while get_into(event):
+                bit = 1 << event.key_number
+                if event.pressed:
+                    state |= bit
+                else:
+                    state &= ~bit
+            self.state = state
+            
+            if state == self.last_state:
+                return
             
-            # Check for new button presses
-            if up_pressed and not up_pressed == self.last_up_state:
+            press = _PRESS_TABLE[(self.last_state << 2) | state]
+            self.last_state = state
+            
+            if press == _PRESS_UP:
                 if self.current_position < self.max_position:
                     self.current_position += 1
-                    events.append(('rotation', 0, 1, self.current_position))
                     log(TAG_ENCODER, f"Octave up: {self.current_position}")
+                    callback(1)
                 else:
                     log(TAG_ENCODER, f"At max octave: {self.current_position}")
                     
-            if down_pressed and not down_pressed == self.last_down_state:
+            elif press == _PRESS_DOWN:
                 if self.current_position > self.min_position:
                     self.current_position -= 1
-                    events.append(('rotation', 0, -1, self.current_position))
                     log(TAG_ENCODER, f"Octave down: {self.current_position}")
+                    callback(-1)
                 else:
                     log(TAG_ENCODER, f"At min octave: {self.current_position}")
             
-            # Update button states
-            self.last_up_state = up_pressed
-            self.last_down_state = down_pressed
-            
-            return events
-            
         except Exception as e:
             log(TAG_ENCODER, f"Error reading buttons: {str(e)}", is_error=True)
-            return events
 
     def get_position(self):
         """Get current octave position"""
@@ -5,7 +5,9 @@ import digitalio
 from constants import NUM_KEYS
 from pressure import PressureSensorProcessor
 from keystates import KeyStateTracker
-from logging import log, TAG_KEYBD
+from logging import log, log_enabled, TAG_KEYBD
+
+_LOG_KEYBD = log_enabled(TAG_KEYBD)
 
 class KeyboardHandler:
     def __init__(self, l1a_multiplexer, l1b_multiplexer, l2_s0_pin, l2_s1_pin, l2_s2_pin, l2_s3_pin):
@@ -30,6 +32,9 @@ class KeyboardHandler:
             log(TAG_KEYBD, "Initializing state tracker")
             self.state_tracker = KeyStateTracker()
             
+            # Reused by every read_keys() call; valid until the next scan
+            self.changed_keys = []
+            
             log(TAG_KEYBD, "Keyboard handler initialization complete")
         except Exception as e:
             log(TAG_KEYBD, f"Keyboard initialization failed: {str(e)}", is_error=True)
@@ -45,8 +50,12 @@ class KeyboardHandler:
             log(TAG_KEYBD, f"Error setting L2 channel {channel}: {str(e)}", is_error=True)
             
     def read_keys(self):
-        """Read all keys with dual-phase detection"""
-        changed_keys = []
+        """Read all keys with dual-phase detection
+        
+        Returns the handler's shared change list, refilled on each call.
+        """
+        changed_keys = self.changed_keys
+        changed_keys.clear()
         key_index = 0
         
         try:
@@ -90,7 +99,7 @@ class KeyboardHandler:
                 self._process_key_reading(key_index, left_value, right_value, changed_keys)
                 key_index += 1
             
-            if changed_keys:
+            if _LOG_KEYBD and changed_keys:
                 log(TAG_KEYBD, f"Detected {len(changed_keys)} key changes")
             return changed_keys
             
@@ -101,8 +110,6 @@ class KeyboardHandler:
     def _process_key_reading(self, key_index, left_value, right_value, changed_keys):
         """Process individual key readings with MPE calculations"""
         try:
-            start_time = time.monotonic()
-            
             # Convert ADC values to normalized pressures
             left_resistance = self.pressure_processor.adc_to_resistance(left_value)
             right_resistance = self.pressure_processor.adc_to_resistance(right_value)
@@ -124,8 +131,9 @@ class KeyboardHandler:
                 ))
                 
                 # Log key state changes
-                state_type = "activated" if key_state.active else "deactivated"
-                log(TAG_KEYBD, f"Key {key_index} {state_type}: pos={position:.3f}, press={pressure:.3f}")
+                if _LOG_KEYBD:
+                    state_type = "activated" if key_state.active else "deactivated"
+                    log(TAG_KEYBD, f"Key {key_index} {state_type}: pos={position:.3f}, press={pressure:.3f}")
                 
         except Exception as e:
             log(TAG_KEYBD, f"Error processing key {key_index}: {str(e)}", is_error=True)
@@ -5,7 +5,9 @@ from constants import (
     NUM_KEYS,
     INITIAL_ACTIVATION_THRESHOLD, DEACTIVATION_THRESHOLD
 )
-from logging import log, TAG_KEYSTAT
+from logging import log, log_enabled, TAG_KEYSTAT
+
+_LOG_KEYSTAT = log_enabled(TAG_KEYSTAT)
 
 class KeyState:
     def __init__(self):
@@ -26,7 +28,7 @@ class KeyStateTracker:
         try:
             log(TAG_KEYSTAT, f"Initializing key state tracker for {NUM_KEYS} keys")
             self.key_states = [KeyState() for _ in range(NUM_KEYS)]
-            self.active_keys = []
+            self.active_keys = set()
             self.key_hardware_data = {}
             log(TAG_KEYSTAT, "Key state tracker initialized")
         except Exception as e:
@@ -41,7 +43,6 @@ class KeyStateTracker:
             if key_state.active:
                 # Key is already active - use deactivation threshold
                 if max_pressure < DEACTIVATION_THRESHOLD:
-                    # log(TAG_KEYSTAT, f"Key deactivated - pressure: {max_pressure:.3f}")
                     key_state.active = False
                     key_state.initial_position = None  # Reset initial position on deactivation
                     return False
@@ -51,7 +52,6 @@ class KeyStateTracker:
                 if max_pressure >= INITIAL_ACTIVATION_THRESHOLD:
                     key_state.active = True
                     key_state.strike_velocity = max_pressure  # Capture initial velocity
-                    # log(TAG_KEYSTAT, f"Key activated - initial velocity: {key_state.strike_velocity:.3f}")
                     return True
                 return False
         except Exception as e:
@@ -61,7 +61,8 @@ class KeyStateTracker:
     def update_key_state(self, key_index, left_normalized, right_normalized, position, pressure):
         """Update state for a single key and determine if it changed"""
         try:
-            start_time = time.monotonic()
+            # Timing is only measured when it will be logged
+            start_time = time.monotonic() if _LOG_KEYSTAT else 0
             key_state = self.key_states[key_index]
             is_active = self.check_key_activation(left_normalized, right_normalized, key_state)
             
@@ -71,17 +72,13 @@ class KeyStateTracker:
                 "R": right_normalized,
                 "position": position,
                 "pressure": pressure,
-                "processing_time": time.monotonic() - start_time
+                "processing_time": time.monotonic() - start_time if _LOG_KEYSTAT else 0
             }
             
             if is_active:
-                if key_index not in self.active_keys:
-                    self.active_keys.append(key_index)
-                    # log(TAG_KEYSTAT, f"Key {key_index} added to active keys")
+                self.active_keys.add(key_index)
             else:
-                if key_index in self.active_keys:
-                    self.active_keys.remove(key_index)
-                    # log(TAG_KEYSTAT, f"Key {key_index} removed from active keys")
+                self.active_keys.discard(key_index)
 
             # Check if state changed
             if (left_normalized != key_state.left_value or 
@@ -90,7 +87,7 @@ class KeyStateTracker:
                 pressure != key_state.pressure):
                 
                 # Log significant changes in position or pressure (>10%)
-                if abs(position - key_state.position) > 0.1 or abs(pressure - key_state.pressure) > 0.1:
+                if _LOG_KEYSTAT and (abs(position - key_state.position) > 0.1 or abs(pressure - key_state.pressure) > 0.1):
                     log(TAG_KEYSTAT, f"Key {key_index} significant change:")
                     log(TAG_KEYSTAT, f"L/R: {left_normalized:.3f}/{right_normalized:.3f}")
                     log(TAG_KEYSTAT, f"Position: {position:.3f}, Pressure: {pressure:.3f}")
@@ -99,11 +96,14 @@ class KeyStateTracker:
                 key_state.right_value = right_normalized
                 key_state.position = position
                 key_state.pressure = pressure
-                key_state.last_update = time.monotonic()
+                # One clock read serves both the timestamp and the timing check
+                now = time.monotonic()
+                key_state.last_update = now
                 
-                processing_time = time.monotonic() - start_time
-                if processing_time > 0.001:  # Log if processing takes more than 1ms
-                    log(TAG_KEYSTAT, f"Key {key_index} update took {processing_time*1000:.2f}ms")
+                if _LOG_KEYSTAT:
+                    processing_time = now - start_time
+                    if processing_time > 0.001:  # Log if processing takes more than 1ms
+                        log(TAG_KEYSTAT, f"Key {key_index} update took {processing_time*1000:.2f}ms")
                 
                 return True
             return False
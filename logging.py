@@ -41,7 +41,6 @@ TAG_CONNECT = 'CONNECT '   # connection.py
 TAG_CONTROL = 'CONTROL '   # controls.py
 TAG_COORD = 'COORD   '     # coordinator.py
 TAG_ENCODER = 'ENCODER '   # encoder.py
-TAG_HARDWAR = 'HARDWAR'    # hardware.py
 TAG_HW = 'HW      '     # Hardware operations
 TAG_KEYBD = 'KEYBD   '     # keyboard.py
 TAG_KEYSTAT = 'KEYSTAT '   # keystates.py
@@ -65,7 +64,6 @@ TAG_COLORS = {
     TAG_CONTROL: COLOR_SAGE,        # controls.py - Sage
     TAG_COORD: COLOR_AQUA,          # coordinator.py - Aqua
     TAG_ENCODER: COLOR_SKY,         # encoder.py - Sky Blue
-    TAG_HARDWAR: COLOR_LAVENDER,    # hardware.py - Lavender
     TAG_HW: COLOR_GOLD,             # Hardware ops - Gold
     TAG_KEYBD: COLOR_PINK,          # keyboard.py - Pink
     TAG_KEYSTAT: COLOR_CORAL,       # keystates.py - Coral
@@ -88,7 +86,6 @@ LOG_ENABLE = {
     TAG_CONTROL: False,
     TAG_COORD: False,
     TAG_ENCODER: True,
-    TAG_HARDWAR: False,
     TAG_HW: False,
     TAG_KEYBD: False,
     TAG_KEYSTAT: False,
@@ -106,6 +103,7 @@ LOG_ENABLE = {
 
 # Special debug flags
 HEARTBEAT_DEBUG = False
+STARTUP_ANIMATION = False  # Animate startup/shutdown messages (blocks ~1s per message)
 
 def log(tag, message, is_error=False, is_heartbeat=False):
     """
@@ -137,8 +135,17 @@ def log(tag, message, is_error=False, is_heartbeat=False):
     else:
         print(f"{color}[{tag}] {message}{COLOR_RESET}", file=sys.stderr)
 
+def log_enabled(tag):
+    """Return whether log() would emit non-error output for this tag.
+    
+    Hot paths cache this at import and test it before building f-strings,
+    so disabled tags cost nothing in formatting or garbage.
+    """
+    return LOG_ENABLE.get(tag, True)
+
 # Example usage:
 # from logging import log, TAG_BARTLEBY
 # log(TAG_BARTLEBY, 'Starting system')
 # log(TAG_BARTLEBY, 'Failed to initialize', is_error=True)
 # log(TAG_CONNECT, '♡', is_heartbeat=True)  # Only logs if HEARTBEAT_DEBUG is True
+# if _LOG_BARTLEBY: log(TAG_BARTLEBY, f"Value: {value}")  # _LOG_BARTLEBY = log_enabled(TAG_BARTLEBY)
@@ -1,45 +1,32 @@
 """MIDI message routing and transport management."""
 
-import time
 import math
-import busio
-import adafruit_midi
 import usb_midi
-from adafruit_midi.note_on import NoteOn
-from adafruit_midi.note_off import NoteOff
-from adafruit_midi.pitch_bend import PitchBend
-from adafruit_midi.control_change import ControlChange
-from adafruit_midi.channel_pressure import ChannelPressure
 from constants import (
-    UART_BAUDRATE,
-    UART_TIMEOUT,
     ZONE_MANAGER,
+    MIDI_BATCH_SIZE,
     PITCH_BEND_MAX,
     PRESSURE_CURVE,
     BEND_CURVE
 )
-from logging import log, TAG_MESSAGE
+from logging import log, log_enabled, TAG_MESSAGE
+
+_LOG_MESSAGE = log_enabled(TAG_MESSAGE)
 
 class MidiTransportManager:
     """Manages MIDI output streams using both UART and USB MIDI"""
     def __init__(self, transport_manager, midi_callback=None):
         try:
             log(TAG_MESSAGE, "Initializing MIDI transport manager")
-            # Initialize UART MIDI
+            # Raw MIDI bytes are written straight to the shared UART and the
+            # USB MIDI out port; there is exactly one write path per output
             self.uart = transport_manager.get_uart()
-            self.uart_midi = adafruit_midi.MIDI(
-                midi_out=self.uart, 
-                out_channel=ZONE_MANAGER
-            )
             self.uart_initialized = True
             log(TAG_MESSAGE, "UART MIDI initialized")
             
             # Initialize USB MIDI
             try:
-                self.usb_midi = adafruit_midi.MIDI(
-                    midi_out=usb_midi.ports[1],
-                    out_channel=ZONE_MANAGER
-                )
+                self.usb_port = usb_midi.ports[1]
                 self.usb_initialized = True
                 log(TAG_MESSAGE, "USB MIDI initialized")
             except Exception as e:
@@ -49,36 +36,117 @@ class MidiTransportManager:
             self.midi_callback = midi_callback
             # Track last message type per channel in stream
             self.channels_in_stream = {}
+            # Raw messages queued between begin_batch() and flush()
+            # Fixed buffer plus fill index so batching never allocates
+            self.batching = False
+            self.batch = bytearray(MIDI_BATCH_SIZE)
+            self.batch_view = memoryview(self.batch)
+            self.batch_len = 0
             log(TAG_MESSAGE, "MIDI transport initialization complete")
         except Exception as e:
             log(TAG_MESSAGE, f"Failed to initialize MIDI transport: {str(e)}", is_error=True)
             raise
 
-    def send_message(self, message):
-        """Send MIDI message to both UART and USB MIDI outputs"""
+    def send_two_byte(self, status_byte, data1):
+        """Send a two-byte channel message, storing its bytes straight into the batch buffer"""
         try:
-            if isinstance(message, list):
-                # Track message type for channel
-                status_byte = message[0]
-                message_type = status_byte & 0xF0
-                channel = status_byte & 0x0F
-                self.channels_in_stream[channel] = message_type
-                
-                if self.uart_initialized:
-                    self.uart.write(bytes(message))
-                if self.usb_initialized:
-                    usb_midi.ports[1].write(bytes(message))
-                
-                log(TAG_MESSAGE, f"Message type 0x{message_type:02X} in stream for channel {channel}")
-            else:
-                if self.uart_initialized:
-                    self.uart_midi.send(message)
-                if self.usb_initialized:
-                    self.usb_midi.send(message)
-                    
+            self.channels_in_stream[status_byte & 0x0F] = status_byte & 0xF0
+            index = self.batch_len
+            if index + 2 > MIDI_BATCH_SIZE:
+                self._drain()
+                index = 0
+            batch = self.batch
+            batch[index] = status_byte
+            batch[index + 1] = data1
+            self.batch_len = index + 2
+            if not self.batching:
+                self._drain()
+        except Exception as e:
+            log(TAG_MESSAGE, f"Error sending MIDI message: {str(e)}", is_error=True)
+
+    def send_three_byte(self, status_byte, data1, data2):
+        """Send a three-byte channel message, storing its bytes straight into the batch buffer"""
+        try:
+            self.channels_in_stream[status_byte & 0x0F] = status_byte & 0xF0
+            index = self.batch_len
+            if index + 3 > MIDI_BATCH_SIZE:
+                self._drain()
+                index = 0
+            batch = self.batch
+            batch[index] = status_byte
+            batch[index + 1] = data1
+            batch[index + 2] = data2
+            self.batch_len = index + 3
+            if not self.batching:
+                self._drain()
         except Exception as e:
             log(TAG_MESSAGE, f"Error sending MIDI message: {str(e)}", is_error=True)
 
+    def send_messages(self, messages):
+        """Send several raw MIDI messages as a single write to each output"""
+        try:
+            # Only the call that opens the batch closes it, so nesting inside
+            # begin_batch()/flush() keeps queueing
+            opened = not self.batching
+            if opened:
+                self.batching = True
+            try:
+                for message in messages:
+                    # Track message type for channel
+                    status_byte = message[0]
+                    self.channels_in_stream[status_byte & 0x0F] = status_byte & 0xF0
+                    self._queue(message)
+            finally:
+                if opened:
+                    self.flush()
+                
+            if _LOG_MESSAGE:
+                log(TAG_MESSAGE, f"Sent {len(messages)} messages in one write")
+        except Exception as e:
+            log(TAG_MESSAGE, f"Error sending MIDI messages: {str(e)}", is_error=True)
+
+    def begin_batch(self):
+        """Queue raw messages until flush() instead of writing each one"""
+        self.batching = True
+
+    def flush(self):
+        """Write queued messages as one write per output and end the batch"""
+        self.batching = False
+        self._drain()
+
+    def _queue(self, message):
+        """Copy one raw message into the batch buffer, draining it first if full"""
+        index = self.batch_len
+        if index + len(message) > MIDI_BATCH_SIZE:
+            self._drain()
+            index = 0
+        # Store byte by byte rather than building a temporary bytes object
+        batch = self.batch
+        for value in message:
+            batch[index] = value
+            index += 1
+        self.batch_len = index
+
+    def _drain(self):
+        """Write whatever is queued and reset the fill index"""
+        length = self.batch_len
+        if not length:
+            return
+        self.batch_len = 0
+        try:
+            self._write(self.batch_view[:length])
+            if _LOG_MESSAGE:
+                log(TAG_MESSAGE, f"Flushed {length} batched bytes")
+        except Exception as e:
+            log(TAG_MESSAGE, f"Error flushing MIDI batch: {str(e)}", is_error=True)
+
+    def _write(self, data):
+        """Write encoded MIDI bytes to every initialized output"""
+        if self.uart_initialized:
+            self.uart.write(data)
+        if self.usb_initialized:
+            self.usb_port.write(data)
+
     def is_note_off_in_stream(self, channel):
         """Check if Note Off is the last message in stream for channel"""
         return self.channels_in_stream.get(channel) == 0x80
@@ -105,6 +173,7 @@ class MidiTransportManager:
         """Clean shutdown of MIDI transports"""
         try:
             log(TAG_MESSAGE, "Starting MIDI transport cleanup")
+            self.flush()
             self.channels_in_stream.clear()
             # Don't deinit UART here since we don't own it
             self.uart_initialized = False
@@ -118,13 +187,16 @@ class MidiMessageSender:
         try:
             log(TAG_MESSAGE, "Initializing MIDI message sender")
             self.transport = transport
+            # Per-event senders go straight to the transport without a wrapper call
+            self.send_two_byte = transport.send_two_byte
+            self.send_three_byte = transport.send_three_byte
         except Exception as e:
             log(TAG_MESSAGE, f"Failed to initialize message sender: {str(e)}", is_error=True)
             raise
 
-    def send_message(self, message):
-        """Send a MIDI message directly"""
-        self.transport.send_message(message)
+    def send_messages(self, messages):
+        """Send several MIDI messages in one batched write"""
+        self.transport.send_messages(messages)
 
     def is_note_off_in_stream(self, channel):
         """Check if Note Off is in stream for channel"""
@@ -137,6 +209,16 @@ class MidiEventRouter:
             log(TAG_MESSAGE, "Initializing MIDI event router")
             self.message_sender = message_sender
             self.channel_manager = channel_manager
+            # Event type -> bound handler, so routing is one dict lookup
+            self.handlers = {
+                'pressure_init': self._handle_pressure_init,
+                'pressure_update': self._handle_pressure_update,
+                'pitch_bend_init': self._handle_pitch_bend_init,
+                'pitch_bend_update': self._handle_pitch_bend_update,
+                'note_on': self._handle_note_on,
+                'note_off': self._handle_note_off,
+                'control_change': self._handle_control_change
+            }
             # Initialize message statistics
             self.message_stats = {
                 'pitch_bend': {'allowed': 0, 'filtered': 0},
@@ -150,25 +232,11 @@ class MidiEventRouter:
     def handle_event(self, event):
         """Handle a MIDI event"""
         try:
-            event_type = event[0]
-            params = event[1:]
-            
-            if event_type == 'pressure_init':
-                self._handle_pressure_init(*params)
-            elif event_type == 'pressure_update':
-                self._handle_pressure_update(*params)
-            elif event_type == 'pitch_bend_init':
-                self._handle_pitch_bend_init(*params)
-            elif event_type == 'pitch_bend_update':
-                self._handle_pitch_bend_update(*params)
-            elif event_type == 'note_on':
-                self._handle_note_on(*params)
-            elif event_type == 'note_off':
-                self._handle_note_off(*params)
-            elif event_type == 'control_change':
-                self._handle_control_change(*params)
+            handler = self.handlers.get(event[0])
+            if handler is None:
+                log(TAG_MESSAGE, f"Unknown event type: {event[0]}", is_error=True)
             else:
-                log(TAG_MESSAGE, f"Unknown event type: {event_type}", is_error=True)
+                handler(*event[1:])
                 
         except Exception as e:
             log(TAG_MESSAGE, f"Error handling event {event}: {str(e)}", is_error=True)
@@ -203,7 +271,8 @@ class MidiEventRouter:
                     scaled = 0.5 + curved
             
             pressure_value = int(scaled * 127)
-            log(TAG_MESSAGE, f"Pressure: {pressure_value}")
+            if _LOG_MESSAGE:
+                log(TAG_MESSAGE, f"Pressure: {pressure_value}")
             return pressure_value
             
         except Exception as e:
@@ -251,7 +320,8 @@ class MidiEventRouter:
             # Clamp to valid range
             bend_value = max(0, min(PITCH_BEND_MAX, bend_value))
             
-            log(TAG_MESSAGE, f"Bend: {bend_value}")
+            if _LOG_MESSAGE:
+                log(TAG_MESSAGE, f"Bend: {bend_value}")
             return bend_value
             
         except Exception as e:
@@ -263,9 +333,10 @@ class MidiEventRouter:
             channel = self.channel_manager.allocate_channel(key_id)
             if channel is not None:  # Only proceed if we got a valid channel
                 pressure_value = self._calculate_pressure(pressure)
-                self.message_sender.send_message([0xD0 | channel, pressure_value])
-                log(TAG_MESSAGE, f"Created Channel Pressure: ch={channel} pressure={pressure_value}")
-                log(TAG_MESSAGE, f"MPE Pressure: zone=lower ch={channel} pressure={pressure_value}")
+                self.message_sender.send_two_byte(0xD0 | channel, pressure_value)
+                if _LOG_MESSAGE:
+                    log(TAG_MESSAGE, f"Created Channel Pressure: ch={channel} pressure={pressure_value}")
+                    log(TAG_MESSAGE, f"MPE Pressure: zone=lower ch={channel} pressure={pressure_value}")
                 self.message_stats['pressure']['allowed'] += 1
         except Exception as e:
             log(TAG_MESSAGE, f"Error initializing pressure: {str(e)}", is_error=True)
@@ -277,9 +348,10 @@ class MidiEventRouter:
                 pressure_value = self._calculate_pressure(pressure)
                 # Only send if pressure has changed
                 if pressure_value != note_state.pressure:
-                    self.message_sender.send_message([0xD0 | note_state.channel, pressure_value])
-                    log(TAG_MESSAGE, f"Created Channel Pressure: ch={note_state.channel} pressure={pressure_value}")
-                    log(TAG_MESSAGE, f"MPE Pressure: zone=lower ch={note_state.channel} pressure={pressure_value}")
+                    self.message_sender.send_two_byte(0xD0 | note_state.channel, pressure_value)
+                    if _LOG_MESSAGE:
+                        log(TAG_MESSAGE, f"Created Channel Pressure: ch={note_state.channel} pressure={pressure_value}")
+                        log(TAG_MESSAGE, f"MPE Pressure: zone=lower ch={note_state.channel} pressure={pressure_value}")
                     note_state.pressure = pressure_value
                     self.message_stats['pressure']['allowed'] += 1
         except Exception as e:
@@ -295,9 +367,10 @@ class MidiEventRouter:
                 bend_value = self._calculate_pitch_bend(position, None)  # Pass None to check initial position
                 lsb = bend_value & 0x7F
                 msb = (bend_value >> 7) & 0x7F
-                self.message_sender.send_message([0xE0 | channel, lsb, msb])
-                log(TAG_MESSAGE, f"Created Pitch Bend: ch={channel} value={bend_value}")
-                log(TAG_MESSAGE, f"MPE Pitch Bend: zone=lower ch={channel} value={bend_value}")
+                self.message_sender.send_three_byte(0xE0 | channel, lsb, msb)
+                if _LOG_MESSAGE:
+                    log(TAG_MESSAGE, f"Created Pitch Bend: ch={channel} value={bend_value}")
+                    log(TAG_MESSAGE, f"MPE Pitch Bend: zone=lower ch={channel} value={bend_value}")
                 self.message_stats['pitch_bend']['allowed'] += 1
         except Exception as e:
             log(TAG_MESSAGE, f"Error initializing pitch bend: {str(e)}", is_error=True)
@@ -310,9 +383,10 @@ class MidiEventRouter:
                 if bend_value != note_state.pitch_bend:
                     lsb = bend_value & 0x7F
                     msb = (bend_value >> 7) & 0x7F
-                    self.message_sender.send_message([0xE0 | note_state.channel, lsb, msb])
-                    log(TAG_MESSAGE, f"Created Pitch Bend: ch={note_state.channel} value={bend_value}")
-                    log(TAG_MESSAGE, f"MPE Pitch Bend: zone=lower ch={note_state.channel} value={bend_value}")
+                    self.message_sender.send_three_byte(0xE0 | note_state.channel, lsb, msb)
+                    if _LOG_MESSAGE:
+                        log(TAG_MESSAGE, f"Created Pitch Bend: ch={note_state.channel} value={bend_value}")
+                        log(TAG_MESSAGE, f"MPE Pitch Bend: zone=lower ch={note_state.channel} value={bend_value}")
                     note_state.pitch_bend = bend_value
                     self.message_stats['pitch_bend']['allowed'] += 1
         except Exception as e:
@@ -323,9 +397,10 @@ class MidiEventRouter:
             channel = self.channel_manager.allocate_channel(key_id)
             if channel is not None:  # Only proceed if we got a valid channel
                 self.channel_manager.add_note(key_id, midi_note, channel, velocity)
-                self.message_sender.send_message([0x90 | channel, int(midi_note), velocity])
-                log(TAG_MESSAGE, f"Created Note note_on: ch={channel} note={midi_note} vel={velocity}")
-                log(TAG_MESSAGE, f"MPE Note On: zone=lower ch={channel} note={midi_note} vel={velocity}")
+                self.message_sender.send_three_byte(0x90 | channel, int(midi_note), velocity)
+                if _LOG_MESSAGE:
+                    log(TAG_MESSAGE, f"Created Note note_on: ch={channel} note={midi_note} vel={velocity}")
+                    log(TAG_MESSAGE, f"MPE Note On: zone=lower ch={channel} note={midi_note} vel={velocity}")
         except Exception as e:
             log(TAG_MESSAGE, f"Error handling note on: {str(e)}", is_error=True)
 
@@ -335,21 +410,24 @@ class MidiEventRouter:
             if note_state:
                 channel = note_state.channel
                 # Send Note Off
-                self.message_sender.send_message([0x80 | channel, int(midi_note), velocity])
-                log(TAG_MESSAGE, f"Created Note Off: ch={channel} note={midi_note} vel={velocity}")
-                log(TAG_MESSAGE, f"MPE Note Off: zone=lower ch={channel} note={midi_note} vel={velocity}")
+                self.message_sender.send_three_byte(0x80 | channel, int(midi_note), velocity)
+                if _LOG_MESSAGE:
+                    log(TAG_MESSAGE, f"Created Note Off: ch={channel} note={midi_note} vel={velocity}")
+                    log(TAG_MESSAGE, f"MPE Note Off: zone=lower ch={channel} note={midi_note} vel={velocity}")
                 
                 # Only release channel once Note Off is in stream
                 if self.message_sender.is_note_off_in_stream(channel):
                     self.channel_manager.release_note(key_id)
-                    log(TAG_MESSAGE, f"Channel {channel} released after Note Off confirmed in stream")
+                    if _LOG_MESSAGE:
+                        log(TAG_MESSAGE, f"Channel {channel} released after Note Off confirmed in stream")
         except Exception as e:
             log(TAG_MESSAGE, f"Error handling note off: {str(e)}", is_error=True)
 
     def _handle_control_change(self, cc_number, midi_value):
         try:
-            self.message_sender.send_message([0xB0 | ZONE_MANAGER, cc_number, midi_value])
-            log(TAG_MESSAGE, f"Created Control Change: ch={ZONE_MANAGER} cc={cc_number} value={midi_value}")
-            log(TAG_MESSAGE, f"MPE Control Change: zone=lower ch={ZONE_MANAGER} cc={cc_number} value={midi_value}")
+            self.message_sender.send_three_byte(0xB0 | ZONE_MANAGER, cc_number, midi_value)
+            if _LOG_MESSAGE:
+                log(TAG_MESSAGE, f"Created Control Change: ch={ZONE_MANAGER} cc={cc_number} value={midi_value}")
+                log(TAG_MESSAGE, f"MPE Control Change: zone=lower ch={ZONE_MANAGER} cc={cc_number} value={midi_value}")
         except Exception as e:
             log(TAG_MESSAGE, f"Error handling control change: {str(e)}", is_error=True)
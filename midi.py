@@ -1,17 +1,13 @@
 """Main MIDI logic and coordination for Bartleby synthesizer."""
 
-import time
-from constants import (
-    CC_TIMBRE,
-    TIMBRE_CENTER,
-    ZONE_MANAGER
-)
 from notes import MPENoteProcessor
 from zones import ZoneManager
 from controls import MidiControlProcessor
 from messages import MidiTransportManager, MidiMessageSender, MidiEventRouter
 from config import MPEConfigurator
-from logging import log, TAG_MIDI
+from logging import log, log_enabled, TAG_MIDI
+
+_LOG_MIDI = log_enabled(TAG_MIDI)
 
 class MidiLogic:
     """Main MIDI logic coordinator class"""
@@ -62,59 +58,36 @@ class MidiLogic:
         midi_events = []
         
         if changed_keys:
-            log(TAG_MIDI, f"Processing {len(changed_keys)} key changes")
+            if _LOG_MIDI:
+                log(TAG_MIDI, f"Processing {len(changed_keys)} key changes")
             midi_events.extend(self.note_processor.process_key_changes(changed_keys, config))
         
         if changed_pots:
-            log(TAG_MIDI, f"Processing {len(changed_pots)} controller changes")
+            if _LOG_MIDI:
+                log(TAG_MIDI, f"Processing {len(changed_pots)} controller changes")
             midi_events.extend(self.control_processor.process_controller_changes(changed_pots))
         
-        for event in midi_events:
-            self.event_router.handle_event(event)
+        # Route every event of this update into one write per output
+        self.transport.begin_batch()
+        try:
+            for event in midi_events:
+                self.event_router.handle_event(event)
+        finally:
+            self.transport.flush()
             
         return midi_events
 
     def handle_octave_shift(self, direction):
-        log(TAG_MIDI, f"Handling octave shift: {direction}")
+        if _LOG_MIDI:
+            log(TAG_MIDI, f"Handling octave shift: {direction}")
         midi_events = self.note_processor.handle_octave_shift(direction)
-        for event in midi_events:
-            self.event_router.handle_event(event)
-        return midi_events
-
-    def play_greeting(self):
-        """Play greeting chime using MPE"""
-        log(TAG_MIDI, "Playing MPE greeting sequence")
-            
-        base_key_id = -1
-        base_pressure = 0.75
-        
-        greeting_notes = [60, 64, 67, 72]
-        velocities = [0.6, 0.7, 0.8, 0.9]
-        durations = [0.2, 0.2, 0.2, 0.4]
-        
+        self.transport.begin_batch()
         try:
-            for idx, (note, velocity, duration) in enumerate(zip(greeting_notes, velocities, durations)):
-                key_id = base_key_id - idx
-                channel = self.channel_manager.allocate_channel(key_id)
-                note_state = self.channel_manager.add_note(key_id, note, channel, int(velocity * 127))
-                
-                # Send in MPE order: CC74 → Pressure → Pitch Bend → Note On
-                self.message_sender.send_message([0xB0 | channel, CC_TIMBRE, TIMBRE_CENTER])
-                self.message_sender.send_message([0xD0 | channel, int(base_pressure * 127)])
-                self.message_sender.send_message([0xE0 | channel, 0x00, 0x40])  # Center pitch bend
-                self.message_sender.send_message([0x90 | channel, note, int(velocity * 127)])
-                
-                time.sleep(duration)
-                
-                self.message_sender.send_message([0xD0 | channel, 0])  # Zero pressure
-                self.message_sender.send_message([0x80 | channel, note, 0])
-                self.channel_manager.release_note(key_id)
-                
-                time.sleep(0.05)
-                
-                log(TAG_MIDI, f"Played greeting note {idx+1}/4: {note}")
-        except Exception as e:
-            log(TAG_MIDI, f"Error during greeting sequence: {str(e)}", is_error=True)
+            for event in midi_events:
+                self.event_router.handle_event(event)
+        finally:
+            self.transport.flush()
+        return midi_events
 
     def cleanup(self):
         log(TAG_MIDI, "Starting MIDI system cleanup")
@@ -9,7 +9,10 @@ from constants import (
     PITCH_BEND_MAX,
     TIMBRE_CENTER
 )
-from logging import log, TAG_NOTES, TAG_MESSAGE
+from logging import log, log_enabled, TAG_NOTES, TAG_MESSAGE
+
+_LOG_NOTES = log_enabled(TAG_NOTES)
+_LOG_MESSAGE = log_enabled(TAG_MESSAGE)
 
 class NoteState:
     """Memory-efficient note state tracking for CircuitPython with active state tracking"""
@@ -31,12 +34,14 @@ class NoteState:
         self.pressure_history = []
         self.pressure_timestamps = []
         self.initial_position = None  # Store initial position for pitch bend centering
-        log(TAG_NOTES, f"Note {midi_note} activated on channel {channel} with velocity {velocity}")
+        if _LOG_NOTES:
+            log(TAG_NOTES, f"Note {midi_note} activated on channel {channel} with velocity {velocity}")
 
-    def update_pressure(self, pressure):
+    def update_pressure(self, pressure, current_time=None):
         """Update pressure history for release velocity calculation"""
         try:
-            current_time = time.monotonic()
+            if current_time is None:
+                current_time = time.monotonic()
             self.pressure = pressure
             
             # Add new pressure reading with timestamp
@@ -52,7 +57,8 @@ class NoteState:
             if len(self.pressure_history) > 1:
                 change = abs(self.pressure_history[-1] - self.pressure_history[-2])
                 if change > 0.2:
-                    log(TAG_NOTES, f"Note {self.midi_note} significant pressure change: {change:.2f}")
+                    if _LOG_NOTES:
+                        log(TAG_NOTES, f"Note {self.midi_note} significant pressure change: {change:.2f}")
                     
         except Exception as e:
             log(TAG_NOTES, f"Error updating pressure: {str(e)}", is_error=True)
@@ -60,12 +66,14 @@ class NoteState:
     def calculate_release_velocity(self):
         """Calculate release velocity based on pressure decay rate with weighted average"""
         try:
-            log(TAG_MESSAGE, f"Note {self.midi_note} calculating release velocity...")
-            log(TAG_MESSAGE, f"Pressure history: {self.pressure_history}")
-            log(TAG_MESSAGE, f"Pressure timestamps: {[t - self.pressure_timestamps[0] for t in self.pressure_timestamps]}")
+            if _LOG_MESSAGE:
+                log(TAG_MESSAGE, f"Note {self.midi_note} calculating release velocity...")
+                log(TAG_MESSAGE, f"Pressure history: {self.pressure_history}")
+                log(TAG_MESSAGE, f"Pressure timestamps: {[t - self.pressure_timestamps[0] for t in self.pressure_timestamps]}")
             
             if len(self.pressure_history) < 2:
-                log(TAG_MESSAGE, f"Note {self.midi_note} insufficient pressure history")
+                if _LOG_MESSAGE:
+                    log(TAG_MESSAGE, f"Note {self.midi_note} insufficient pressure history")
                 return 0
                 
             # Calculate weighted average of rates, earlier changes count more
@@ -84,24 +92,29 @@ class NoteState:
                     total_weight += weight
                     changes.append((pressure_change, time_change, rate, weight))
             
-            log(TAG_MESSAGE, f"Note {self.midi_note} pressure changes: {changes}")
+            if _LOG_MESSAGE:
+                log(TAG_MESSAGE, f"Note {self.midi_note} pressure changes: {changes}")
             
             if total_weight == 0:
-                log(TAG_MESSAGE, f"Note {self.midi_note} no valid changes")
+                if _LOG_MESSAGE:
+                    log(TAG_MESSAGE, f"Note {self.midi_note} no valid changes")
                 return 0
                 
             avg_decay_rate = total_weighted_rate / total_weight
-            log(TAG_MESSAGE, f"Note {self.midi_note} weighted avg decay rate: {avg_decay_rate:.3f}")
+            if _LOG_MESSAGE:
+                log(TAG_MESSAGE, f"Note {self.midi_note} weighted avg decay rate: {avg_decay_rate:.3f}")
             
             # Convert decay rate to MIDI velocity (0-127)
             if avg_decay_rate < RELEASE_VELOCITY_THRESHOLD:
-                log(TAG_MESSAGE, f"Note {self.midi_note} decay rate below threshold")
+                if _LOG_MESSAGE:
+                    log(TAG_MESSAGE, f"Note {self.midi_note} decay rate below threshold")
                 return 0
                 
             # Scale to MIDI velocity with smaller scale factor
             velocity = min(127, int(avg_decay_rate * 32))  # Use 32 instead of 64 for gentler scaling
             
-            log(TAG_MESSAGE, f"Note {self.midi_note} release velocity: {velocity} (decay rate: {avg_decay_rate:.3f})")
+            if _LOG_MESSAGE:
+                log(TAG_MESSAGE, f"Note {self.midi_note} release velocity: {velocity} (decay rate: {avg_decay_rate:.3f})")
             return velocity
             
         except Exception as e:
@@ -142,7 +155,8 @@ class MPENoteProcessor:
                                 'midi_note': midi_note,
                                 'position': position
                             }
-                            log(TAG_NOTES, f"Note {midi_note} pending velocity calculation")
+                            if _LOG_NOTES:
+                                log(TAG_NOTES, f"Note {midi_note} pending velocity calculation")
                         elif current_time - self.pending_velocities[key_id]['time'] >= VELOCITY_DELAY:
                             # Enough time has passed, use the current pressure as velocity
                             velocity = max(1, int(pressure * 127))  # Scale normalized pressure to MIDI range
@@ -154,10 +168,11 @@ class MPENoteProcessor:
                             ])
                             self.active_notes.add(key_id)
                             del self.pending_velocities[key_id]
-                            log(TAG_NOTES, f"Note {midi_note} activated: vel={velocity}, pos={position:.2f}, press={pressure:.2f}")
+                            if _LOG_NOTES:
+                                log(TAG_NOTES, f"Note {midi_note} activated: vel={velocity}, pos={position:.2f}, press={pressure:.2f}")
                     
                     elif note_state.active:
-                        note_state.update_pressure(pressure)
+                        note_state.update_pressure(pressure, current_time)
                         midi_events.extend([
                             ('pressure_update', key_id, pressure),
                             ('pitch_bend_update', key_id, position)
@@ -175,7 +190,8 @@ class MPENoteProcessor:
                             ('note_off', midi_note, release_velocity, key_id)
                         ])
                         self.active_notes.remove(key_id)
-                        log(TAG_NOTES, f"Note {midi_note} released: velocity={release_velocity}")
+                        if _LOG_NOTES:
+                            log(TAG_NOTES, f"Note {midi_note} released: velocity={release_velocity}")
 
             return midi_events
             
@@ -213,7 +229,8 @@ class MPENoteProcessor:
                             ('pitch_bend_update', note_state.key_id, position)
                         ])
                         
-                    log(TAG_NOTES, f"Note shifted: {old_note} -> {new_note}")
+                    if _LOG_NOTES:
+                        log(TAG_NOTES, f"Note shifted: {old_note} -> {new_note}")
                 
             return midi_events
             
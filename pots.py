@@ -6,7 +6,9 @@ from constants import (
     POT_LOWER_TRIM, POT_UPPER_TRIM,
     NUM_POTS, POT_LOG_THRESHOLD
 )
-from logging import log, TAG_POTS
+from logging import log, log_enabled, TAG_POTS
+
+_LOG_POTS = log_enabled(TAG_POTS)
 
 class PotentiometerHandler:
     def __init__(self, multiplexer):
@@ -18,6 +20,8 @@ class PotentiometerHandler:
             self.last_normalized_values = [0.0] * NUM_POTS
             self.is_active = [False] * NUM_POTS
             self.last_change = [0] * NUM_POTS
+            # Reused by every read_pots() call; valid until the next scan
+            self.changed_pots = []
             log(TAG_POTS, "Potentiometer handler initialized")
         except Exception as e:
             log(TAG_POTS, f"Failed to initialize potentiometer handler: {str(e)}", is_error=True)
@@ -42,8 +46,12 @@ class PotentiometerHandler:
             return 0.0
 
     def read_pots(self):
-        """Read all potentiometers and return changed values"""
-        changed_pots = []
+        """Read all potentiometers and return changed values
+        
+        Returns the handler's shared change list, refilled on each call.
+        """
+        changed_pots = self.changed_pots
+        changed_pots.clear()
         try:
             for i in range(NUM_POTS):
                 raw_value = self.multiplexer.read_channel(i)
@@ -62,15 +70,15 @@ class PotentiometerHandler:
                             self.last_change[i] = change
                             
                             # Log significant changes
-                            if change_normalized > POT_LOG_THRESHOLD:
+                            if _LOG_POTS and change_normalized > POT_LOG_THRESHOLD:
                                 log(TAG_POTS, f"Pot {i} changed: {self.last_normalized_values[i]:.3f} -> {normalized_new:.3f}")
                                 
                     elif change < POT_THRESHOLD:
-                        if self.is_active[i]:  # Only log transition to inactive
+                        if _LOG_POTS and self.is_active[i]:  # Only log transition to inactive
                             log(TAG_POTS, f"Pot {i} became inactive")
                         self.is_active[i] = False
                 elif change > POT_THRESHOLD:
-                    if not self.is_active[i]:  # Only log transition to active
+                    if _LOG_POTS and not self.is_active[i]:  # Only log transition to active
                         log(TAG_POTS, f"Pot {i} became active")
                     self.is_active[i] = True
                     if normalized_new != self.last_normalized_values[i]:
@@ -80,10 +88,10 @@ class PotentiometerHandler:
                         self.last_change[i] = change
                         
                         # Log significant changes
-                        if change_normalized > POT_LOG_THRESHOLD:
+                        if _LOG_POTS and change_normalized > POT_LOG_THRESHOLD:
                             log(TAG_POTS, f"Pot {i} changed: {self.last_normalized_values[i]:.3f} -> {normalized_new:.3f}")
             
-            if changed_pots:
+            if _LOG_POTS and changed_pots:
                 log(TAG_POTS, f"Detected {len(changed_pots)} pot changes")
             return changed_pots
             
@@ -5,7 +5,9 @@ from constants import (
     MAX_VK_RESISTANCE, MIN_VK_RESISTANCE,
     REST_VOLTAGE_THRESHOLD, ADC_RESISTANCE_SCALE
 )
-from logging import log, TAG_PRESSUR
+from logging import log, log_enabled, TAG_PRESSUR
+
+_LOG_PRESSUR = log_enabled(TAG_PRESSUR)
 
 class PressureSensorProcessor:
     def __init__(self):
@@ -75,7 +77,8 @@ class PressureSensorProcessor:
             position = (right_norm - left_norm) / total
             
             # Log only the final normalized position
-            log(TAG_PRESSUR, f"Position: {position:.3f}")
+            if _LOG_PRESSUR:
+                log(TAG_PRESSUR, f"Position: {position:.3f}")
                 
             return position
             
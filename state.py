@@ -1,66 +1,81 @@
 """State management for timing and scanning intervals."""
 
 import time
-from constants import POT_SCAN_INTERVAL, ENCODER_SCAN_INTERVAL
+from micropython import const
+from constants import POT_SCAN_INTERVAL_NS, ENCODER_SCAN_INTERVAL_NS, STATE_TICK_INTERVAL_NS
 from logging import log, TAG_STATE
 
+# Gap between loop iterations worth reporting
+_TIME_JUMP_NS = const(1000000000)
+
+# Waits shorter than this spin on the clock; time.sleep is too coarse for them
+_SPIN_THRESHOLD_NS = const(500000)
+
+def sleep_ns(duration_ns, _monotonic_ns=time.monotonic_ns, _sleep=time.sleep):
+    """Wait for duration_ns nanoseconds, spinning for sub-500us waits"""
+    if duration_ns <= 0:
+        return
+    if duration_ns < _SPIN_THRESHOLD_NS:
+        deadline = _monotonic_ns() + duration_ns
+        while _monotonic_ns() < deadline:
+            pass
+    else:
+        _sleep(duration_ns / 1000000000)
+
 class StateManager:
+    """Loop timing in integer nanoseconds from time.monotonic_ns()
+    
+    Scan scheduling is deadline based: update_time() decides once per
+    iteration whether pots and encoders are due and moves their deadlines,
+    so the hardware scan only reads the scan_pots/scan_encoders flags.
+    """
     def __init__(self):
         try:
             self.current_time = 0
-            self.last_pot_scan = 0
-            self.last_encoder_scan = 0
+            self.next_pot_scan = 0
+            self.next_encoder_scan = 0
+            self.next_state_tick = 0
+            self.scan_pots = False
+            self.scan_encoders = False
+            self.tick_state = False
             log(TAG_STATE, "State manager initialized")
         except Exception as e:
             log(TAG_STATE, f"Failed to initialize state manager: {str(e)}", is_error=True)
             raise
         
-    def update_time(self):
-        """Update current time reference"""
+    def update_time(self, _monotonic_ns=time.monotonic_ns,
+                    _pot_interval=POT_SCAN_INTERVAL_NS,
+                    _encoder_interval=ENCODER_SCAN_INTERVAL_NS,
+                    _state_interval=STATE_TICK_INTERVAL_NS):
+        """Update current time reference and work out which scans are due
+        
+        The defaults bind the clock and the imported intervals once at
+        definition time, since const() values from another module are not
+        folded and would otherwise be global lookups on every pass.
+        """
         try:
             previous_time = self.current_time
-            self.current_time = time.monotonic()
+            now = _monotonic_ns()
+            self.current_time = now
             
             # Log significant time jumps (more than 1 second)
             if previous_time > 0:  # Skip first update
-                time_jump = self.current_time - previous_time
-                if time_jump > 1.0:
-                    log(TAG_STATE, f"Time jump detected: {time_jump:.2f}s")
+                time_jump = now - previous_time
+                if time_jump > _TIME_JUMP_NS:
+                    log(TAG_STATE, f"Time jump detected: {time_jump / 1000000000:.2f}s")
+            
+            # Pots and encoders are scanned on their own deadlines
+            self.scan_pots = now >= self.next_pot_scan
+            if self.scan_pots:
+                self.next_pot_scan = now + _pot_interval
+            
+            self.scan_encoders = now >= self.next_encoder_scan
+            if self.scan_encoders:
+                self.next_encoder_scan = now + _encoder_interval
+            
+            # Connection state only needs checking at a coarser tick
+            self.tick_state = now >= self.next_state_tick
+            if self.tick_state:
+                self.next_state_tick = now + _state_interval
         except Exception as e:
             log(TAG_STATE, f"Error updating time: {str(e)}", is_error=True)
-        
-    def should_scan_pots(self):
-        """Check if enough time has passed to scan pots"""
-        try:
-            time_since_scan = self.current_time - self.last_pot_scan
-            should_scan = time_since_scan >= POT_SCAN_INTERVAL
-            return should_scan
-        except Exception as e:
-            log(TAG_STATE, f"Error checking pot scan timing: {str(e)}", is_error=True)
-            return False
-        
-    def should_scan_encoders(self):
-        """Check if enough time has passed to scan encoders"""
-        try:
-            time_since_scan = self.current_time - self.last_encoder_scan
-            should_scan = time_since_scan >= ENCODER_SCAN_INTERVAL
-            return should_scan
-        except Exception as e:
-            log(TAG_STATE, f"Error checking encoder scan timing: {str(e)}", is_error=True)
-            return False
-        
-    def update_pot_scan_time(self):
-        """Update last pot scan time"""
-        try:
-            previous_scan = self.last_pot_scan
-            self.last_pot_scan = self.current_time
-        except Exception as e:
-            log(TAG_STATE, f"Error updating pot scan time: {str(e)}", is_error=True)
-        
-    def update_encoder_scan_time(self):
-        """Update last encoder scan time"""
-        try:
-            previous_scan = self.last_encoder_scan
-            self.last_encoder_scan = self.current_time
-        except Exception as e:
-            log(TAG_STATE, f"Error updating encoder scan time: {str(e)}", is_error=True)
@@ -2,8 +2,22 @@
 
 import busio
 import time
-from constants import MESSAGE_TIMEOUT, BUFFER_CLEAR_TIMEOUT
-from logging import log, TAG_TRANS
+from micropython import const
+from constants import (
+    MESSAGE_TIMEOUT_NS, BUFFER_CLEAR_TIMEOUT,
+    HEARTBEAT, HEARTBEAT_BYTES
+)
+from logging import log, log_enabled, TAG_TRANS, HEARTBEAT_DEBUG
+from state import sleep_ns
+
+_LOG_TRANS = log_enabled(TAG_TRANS)
+
+# Closing sequence for each frame counter digit: ]n]\n
+_END_SEQUENCES = tuple(b"]" + bytes((0x30 + n,)) + b"]\n" for n in range(10))
+_END_SEQUENCE_LENGTH = 4
+
+# Fixed receive buffer; a frame that cannot complete within it is dropped
+_RX_BUFFER_SIZE = const(1024)
 
 class TransportManager:
     """Manages shared UART instance for both text and MIDI communication"""
@@ -67,7 +81,12 @@ class TextUart:
     def __init__(self, uart):
         try:
             self.uart = uart
-            self.buffer = bytearray()
+            # Received bytes live in buffer[start:end]; bytes are read straight
+            # into the free tail, so the buffer is never reallocated
+            self.buffer = bytearray(_RX_BUFFER_SIZE)
+            self.buffer_view = memoryview(self.buffer)
+            self.start = 0
+            self.end = 0
             self.last_write = 0
             self.message_start_time = None
             log(TAG_TRANS, "Text protocol initialized")
@@ -76,95 +95,129 @@ class TextUart:
             raise
 
     def write(self, message):
-        """Write text message with minimum delay between writes"""
+        """Write a str or bytes text message (use write_str/write_bytes when the type is known)"""
+        if isinstance(message, str):
+            return self.write_bytes(message.encode('utf-8'))
+        return self.write_bytes(message)
+
+    def write_str(self, message):
+        """Write a str text message"""
+        return self.write_bytes(message.encode('utf-8'))
+
+    def write_bytes(self, message, _monotonic_ns=time.monotonic_ns):
+        """Write an encoded text message with minimum delay between writes"""
         try:
-            current_time = time.monotonic()
-            delay_needed = MESSAGE_TIMEOUT - (current_time - self.last_write)
-            if delay_needed > 0:
-                time.sleep(delay_needed)
+            # Integer ns arithmetic throughout
+            sleep_ns(MESSAGE_TIMEOUT_NS - (_monotonic_ns() - self.last_write))
                 
-            if isinstance(message, str):
-                message = message.encode('utf-8')
             result = self.uart.write(message)
-            self.last_write = time.monotonic()
+            self.last_write = _monotonic_ns()
             # Only log non-heartbeat messages by default
-            if not message.startswith(b'\xe2\x99\xa1'):  # UTF-8 encoding of ♡
-                log(TAG_TRANS, f"Wrote message of {len(message)} bytes")
-            else:
-                log(TAG_TRANS, "♡", is_heartbeat=True)
+            if not message.startswith(HEARTBEAT_BYTES):
+                if _LOG_TRANS:
+                    log(TAG_TRANS, f"Wrote message of {len(message)} bytes")
+            elif HEARTBEAT_DEBUG:
+                log(TAG_TRANS, HEARTBEAT, is_heartbeat=True)
             return result
         except Exception as e:
             log(TAG_TRANS, f"Error writing message: {str(e)}", is_error=True)
             return 0
 
-    def read(self):
-        """Read available data and return complete messages, handling format [n[message]n]"""
+    def read(self, current_time=None, _monotonic_ns=time.monotonic_ns):
+        """Read available data and return the next complete message, handling format [n[message]n]
+        
+        Call repeatedly until it returns None to drain every complete message.
+        current_time is the caller's monotonic_ns timestamp, sampled here if omitted.
+        """
         try:
-            # If no data waiting, return None
-            if not self.uart.in_waiting:
-                return None
+            if current_time is None:
+                current_time = _monotonic_ns()
 
-            # Read all available data
-            data = self.uart.read()
-            if not data:
-                return None
+            buffer = self.buffer
+            start = self.start
+            end = self.end
 
-            # Start timing when we first see data
-            if self.message_start_time is None:
-                self.message_start_time = time.monotonic()
-
-            # Extend existing buffer
-            self.buffer.extend(data)
+            # Read everything waiting straight into the free tail of the buffer
+            waiting = self.uart.in_waiting
+            if waiting:
+                if end + waiting > _RX_BUFFER_SIZE and start:
+                    # Slide unread bytes to the front to make room
+                    end -= start
+                    self.buffer_view[:end] = self.buffer_view[start:start + end]
+                    start = 0
+                space = _RX_BUFFER_SIZE - end
+                if space:
+                    # Never ask for more than is waiting, so readinto does not block
+                    count = self.uart.readinto(self.buffer_view[end:end + min(waiting, space)])
+                    if count:
+                        # Start timing when we first see data
+                        if self.message_start_time is None:
+                            self.message_start_time = current_time
+                        end += count
+                self.end = end
 
             # Look for start of message
-            while b'[' in self.buffer:
-                start_idx = self.buffer.find(b'[')
+            while True:
+                # Nothing buffered
+                if start >= end:
+                    self.start = self.end = 0
+                    self.message_start_time = None
+                    return None
+
+                start_idx = buffer.find(b'[', start, end)
+                if start_idx < 0:
+                    # No start bracket left - nothing buffered can become a message
+                    self.start = self.end = 0
+                    self.message_start_time = None
+                    return None
                 
                 # Need at least 4 chars for minimal message [n[]]
-                if len(self.buffer) < start_idx + 4:
+                if end < start_idx + 4:
+                    self.start = start_idx
                     # Check if we've been waiting too long for a complete message
-                    if self.message_start_time and (time.monotonic() - self.message_start_time) > MESSAGE_TIMEOUT:
-                        self.buffer = bytearray()
+                    if self.message_start_time is not None and (current_time - self.message_start_time) > MESSAGE_TIMEOUT_NS:
+                        self.start = self.end = 0
                         self.message_start_time = None
                     return None
 
-                # Check if we have counter and second bracket
-                if not self.buffer[start_idx + 1:start_idx + 2].isdigit():
-                    # Invalid format, remove this start bracket and continue
-                    self.buffer = self.buffer[start_idx + 1:]
-                    continue
-
-                if self.buffer[start_idx + 2:start_idx + 3] != b'[':
-                    # Invalid format, remove this start bracket and continue
-                    self.buffer = self.buffer[start_idx + 1:]
+                # Check for counter digit and second bracket without slicing
+                counter = buffer[start_idx + 1] - 0x30
+                if not 0 <= counter <= 9 or buffer[start_idx + 2] != 0x5B:
+                    # Invalid format, skip this start bracket and continue
+                    start = start_idx + 1
                     continue
-
-                # Get the counter digit
-                counter = self.buffer[start_idx + 1:start_idx + 2].decode()
                 
                 # Look for matching end sequence
-                end_sequence = f"]{counter}]\n".encode()
-                end_idx = self.buffer.find(end_sequence, start_idx + 3)
+                end_idx = buffer.find(_END_SEQUENCES[counter], start_idx + 3, end)
                 
                 if end_idx == -1:
+                    self.start = start_idx
                     # Check if we've been waiting too long for the end sequence
-                    if self.message_start_time and (time.monotonic() - self.message_start_time) > MESSAGE_TIMEOUT:
-                        self.buffer = bytearray()
+                    if self.message_start_time is not None and (current_time - self.message_start_time) > MESSAGE_TIMEOUT_NS:
+                        self.start = self.end = 0
                         self.message_start_time = None
+                    # A frame that already fills the buffer can never complete
+                    elif start_idx == 0 and end == _RX_BUFFER_SIZE:
+                        self.start = 1
                     # No complete message yet
-                    if len(self.buffer) > 1024:  # Add safety limit to prevent buffer overflow
-                        self.buffer = self.buffer[start_idx + 1:]
                     return None
 
                 try:
                     # Extract message between inner brackets
-                    message_bytes = self.buffer[start_idx + 3:end_idx]
+                    message_bytes = buffer[start_idx + 3:end_idx]
                     
-                    # Remove processed message from buffer
-                    self.buffer = self.buffer[end_idx + len(end_sequence):]
+                    # Mark processed message as consumed
+                    start = end_idx + _END_SEQUENCE_LENGTH
+                    self.start = start
                     
-                    # Reset message start time
-                    self.message_start_time = None
+                    # Restart the timeout for any partial frame still buffered
+                    self.message_start_time = current_time if start < end else None
+                    
+                    # Heartbeats are matched on raw bytes and skip decoding entirely
+                    if message_bytes == HEARTBEAT_BYTES:
+                        if HEARTBEAT_DEBUG:
+                            log(TAG_TRANS, HEARTBEAT, is_heartbeat=True)
+                        return HEARTBEAT
                     
                     # Decode the complete message
                     message = message_bytes.decode('utf-8')
@@ -209,31 +262,35 @@ class TextUart:
                                 log(TAG_TRANS, "No valid CC assignments found", is_error=True)
                                 continue
                     
-                    # Log appropriately
-                    if message == '♡':
-                        log(TAG_TRANS, "♡", is_heartbeat=True)
-                    else:
+                    if _LOG_TRANS:
                         log(TAG_TRANS, f"Received message: {message}")
                     
                     return message
                     
                 except UnicodeDecodeError:
                     # If we can't decode the message, skip to next start bracket
-                    self.buffer = self.buffer[start_idx + 1:]
+                    start = start_idx + 1
                     continue
 
-            return None
-
         except Exception as e:
             log(TAG_TRANS, f"Error in message reading: {str(e)}", is_error=True)
-            self.buffer = bytearray()
+            self.start = self.end = 0
             self.message_start_time = None
             return None
 
+    def has_data(self):
+        """Check if there is unread UART data or buffered data still to parse
+        
+        Called every main loop pass, so it reads the UART directly rather than
+        through the guarded in_waiting property.
+        """
+        return self.start != self.end or self.uart.in_waiting > 0
+
     def clear_buffer(self):
         """Clear the internal buffer"""
         try:
-            self.buffer = bytearray()
+            # Emptied by resetting the indices; the buffer itself is kept
+            self.start = self.end = 0
             self.message_start_time = None
             log(TAG_TRANS, "Message buffer cleared")
         except Exception as e:
@@ -4,7 +4,9 @@ from constants import (
     ZONE_START,
     ZONE_END
 )
-from logging import log, TAG_ZONES
+from logging import log, log_enabled, TAG_ZONES
+
+_LOG_ZONES = log_enabled(TAG_ZONES)
 
 class ZoneManager:
     def __init__(self):
@@ -28,19 +30,22 @@ class ZoneManager:
             # Check pending allocation first
             if key_id in self.pending_channels:
                 channel = self.pending_channels[key_id]
-                log(TAG_ZONES, f"Using pending channel {channel} for key {key_id}")
+                if _LOG_ZONES:
+                    log(TAG_ZONES, f"Using pending channel {channel} for key {key_id}")
                 return channel
                 
             # Check if note already has an active channel
             if key_id in self.active_notes and self.active_notes[key_id].active:
                 channel = self.active_notes[key_id].channel
-                log(TAG_ZONES, f"Reusing active channel {channel} for key {key_id}")
+                if _LOG_ZONES:
+                    log(TAG_ZONES, f"Reusing active channel {channel} for key {key_id}")
                 return channel
 
             # Find completely free channel
             for channel in self.available_channels:
                 if channel not in self.channel_notes or not self.channel_notes[channel]:
-                    log(TAG_ZONES, f"Allocated free channel {channel} for key {key_id}")
+                    if _LOG_ZONES:
+                        log(TAG_ZONES, f"Allocated free channel {channel} for key {key_id}")
                     self.pending_channels[key_id] = channel
                     return channel
 
@@ -72,12 +77,14 @@ class ZoneManager:
             # Clear pending allocation
             self.pending_channels.pop(key_id, None)
             
-            log(TAG_ZONES, f"Added note: key={key_id}, note={midi_note}, channel={channel}, velocity={velocity}")
+            if _LOG_ZONES:
+                log(TAG_ZONES, f"Added note: key={key_id}, note={midi_note}, channel={channel}, velocity={velocity}")
             
-            # Log channel usage statistics
-            for ch in self.channel_notes:
-                if self.channel_notes[ch]:
-                    log(TAG_ZONES, f"Channel {ch} has {len(self.channel_notes[ch])} active notes")
+            # Log channel usage statistics (walks every channel, so only when enabled)
+            if _LOG_ZONES:
+                for ch, keys in self.channel_notes.items():
+                    if keys:
+                        log(TAG_ZONES, f"Channel {ch} has {len(keys)} active notes")
                     
             return note_state
             
@@ -96,18 +103,21 @@ class ZoneManager:
                 # Clean up channel tracking
                 if channel in self.channel_notes:
                     self.channel_notes[channel].discard(key_id)
-                    log(TAG_ZONES, f"Released channel {channel} from key {key_id}")
+                    if _LOG_ZONES:
+                        log(TAG_ZONES, f"Released channel {channel} from key {key_id}")
                     
                 # Clear any pending allocation
                 self.pending_channels.pop(key_id, None)
                 
                 # Remove inactive note from active_notes to prevent ghost notes
                 del self.active_notes[key_id]
-                log(TAG_ZONES, f"Removed inactive note {key_id} from active_notes")
+                if _LOG_ZONES:
+                    log(TAG_ZONES, f"Removed inactive note {key_id} from active_notes")
                 
-                # Log remaining channel usage
-                active_channels = sum(1 for ch in self.channel_notes if self.channel_notes[ch])
-                log(TAG_ZONES, f"Channels in use after release: {active_channels}")
+                # Log remaining channel usage (walks every channel, so only when enabled)
+                if _LOG_ZONES:
+                    active_channels = sum(1 for keys in self.channel_notes.values() if keys)
+                    log(TAG_ZONES, f"Channels in use after release: {active_channels}")
                 
         except Exception as e:
             log(TAG_ZONES, f"Error releasing note for key {key_id}: {str(e)}", is_error=True)
@@ -129,7 +139,8 @@ class ZoneManager:
         """Get all currently active notes"""
         try:
             active_notes = [note for note in self.active_notes.values() if note.active]
-            log(TAG_ZONES, f"Current active notes: {len(active_notes)}")
+            if _LOG_ZONES:
+                log(TAG_ZONES, f"Current active notes: {len(active_notes)}")
             return active_notes
         except Exception as e:
             log(TAG_ZONES, f"Error getting active notes: {str(e)}", is_error=True)